@@ -6,12 +6,19 @@ This script:
 2. Clones/pulls test fixture repositories from GitHub
 3. Runs testrunner on each repository using the new architecture
 4. Displays results and verifies expected behavior
+
+Set TESTRUNNER_DEBUG=1 to include full tracebacks in per-repo errors.
 """
 
+import functools
+import hashlib
 import json
+import multiprocessing
 import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
@@ -20,10 +27,21 @@ SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
+# Shared download caches so package-manager HTTP fetches are reused across repos
+CACHE_DIR = PROJECT_ROOT / ".cache"
+
+# How long Ollama keeps the model loaded after each request. Every request
+# renews it, so the model stays resident for the run and unloads soon after.
+OLLAMA_KEEP_ALIVE = "10m"
+
+# pip installs into this interpreter's site-packages, which is not safe to do
+# from several installs at once
+_PIP_LOCK = threading.Lock()
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
@@ -57,17 +75,25 @@ def clone_or_pull_repo(repo: dict, test_repos_dir: Path) -> bool:
 
     try:
         if repo_path.exists() and (repo_path / ".git").exists():
-            # Repo exists, pull latest
+            # Repo exists, fetch the remote tip and keep the clone shallow
             console.print(f"  [dim]Pulling latest for {repo_name}...[/dim]")
             result = subprocess.run(
-                ["git", "pull", "--ff-only"],
+                ["git", "fetch", "--depth=1", "origin", "HEAD"],
                 cwd=repo_path,
                 capture_output=True,
                 text=True,
                 timeout=60,
             )
+            if result.returncode == 0:
+                result = subprocess.run(
+                    ["git", "reset", "--hard", "FETCH_HEAD"],
+                    cwd=repo_path,
+                    capture_output=True,
+                    text=True,
+                    timeout=60,
+                )
             if result.returncode != 0:
-                console.print(f"  [yellow]Warning: Pull failed, using existing state[/yellow]")
+                console.print("  [yellow]Warning: Pull failed, using existing state[/yellow]")
             return True
         else:
             # Clone repo
@@ -76,11 +102,16 @@ def clone_or_pull_repo(repo: dict, test_repos_dir: Path) -> bool:
                 import shutil
                 shutil.rmtree(repo_path)
 
+            # Fixtures only need the tip commit, so skip history and tags
             result = subprocess.run(
-                ["git", "clone", repo_url, str(repo_path)],
+                [
+                    "git", "-c", "protocol.version=2", "clone",
+                    "--depth=1", "--single-branch", "--no-tags",
+                    repo_url, str(repo_path),
+                ],
                 capture_output=True,
                 text=True,
-                timeout=120,
+                timeout=60,
             )
             if result.returncode != 0:
                 console.print(f"  [red]Error cloning: {result.stderr}[/red]")
@@ -95,24 +126,67 @@ def clone_or_pull_repo(repo: dict, test_repos_dir: Path) -> bool:
         return False
 
 
-def install_repo_dependencies(repo_path: Path) -> bool:
+def _cache_key_path(repo_path: Path, name: str) -> Path:
+    """Location of the marker recording the last successfully installed lockfile hash.
+
+    Markers live inside .git so they never show up as untracked files in the
+    fixture repo's git analysis.
+    """
+    return repo_path / ".git" / f"testrunner_{name}_cache_key"
+
+
+def _dependencies_up_to_date(repo_path: Path, name: str, lockfile: Path) -> tuple[bool, str]:
+    """Check whether dependencies were already installed from this exact lockfile.
+
+    Returns (up_to_date, lockfile_hash).
+    """
+    key = hashlib.sha256(lockfile.read_bytes()).hexdigest()
+    marker = _cache_key_path(repo_path, name)
+    try:
+        return marker.read_text().strip() == key, key
+    except OSError:
+        return False, key
+
+
+def _record_dependencies(repo_path: Path, name: str, key: str) -> None:
+    """Record a successful install so the next run can skip it."""
+    try:
+        _cache_key_path(repo_path, name).write_text(key)
+    except OSError:
+        pass
+
+
+def install_repo_dependencies(repo_path: Path, messages: list[str]) -> bool:
     """Install dependencies for a test repository.
 
     Handles both Python (requirements.txt) and Node.js (package.json) projects.
+    Python and Node.js installs are skipped when the lockfile is unchanged since
+    the last successful install. pip installs are serialized across threads.
+    Status messages are appended to messages for the caller to print.
     """
     # Python dependencies
     requirements_file = repo_path / "requirements.txt"
     if requirements_file.exists():
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", "-r", str(requirements_file), "-q"],
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-            if result.returncode != 0:
-                console.print(f"  [yellow]Warning: pip install failed[/yellow]")
-                return False
+            up_to_date, key = _dependencies_up_to_date(repo_path, "pip", requirements_file)
+            if up_to_date:
+                messages.append("  [dim]Python dependencies up to date[/dim]")
+            else:
+                with _PIP_LOCK:
+                    result = subprocess.run(
+                        [
+                            sys.executable, "-m", "pip", "install",
+                            "-r", str(requirements_file), "-q",
+                        ],
+                        capture_output=True,
+                        text=True,
+                        timeout=120,
+                        env={**os.environ, "PIP_CACHE_DIR": str(CACHE_DIR / "pip")},
+                    )
+                if result.returncode != 0:
+                    messages.append("  [yellow]Warning: pip install failed[/yellow]")
+                    return False
+                _record_dependencies(repo_path, "pip", key)
         except Exception:
             return False
 
@@ -120,17 +194,30 @@ def install_repo_dependencies(repo_path: Path) -> bool:
     package_json = repo_path / "package.json"
     if package_json.exists():
         try:
-            console.print(f"  [dim]Installing npm dependencies...[/dim]")
-            result = subprocess.run(
-                ["npm", "install"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-            if result.returncode != 0:
-                console.print(f"  [yellow]Warning: npm install failed[/yellow]")
-                return False
+            package_lock = repo_path / "package-lock.json"
+            lockfile = package_lock if package_lock.exists() else package_json
+            up_to_date, key = _dependencies_up_to_date(repo_path, "npm", lockfile)
+            if up_to_date and (repo_path / "node_modules").exists():
+                messages.append("  [dim]npm dependencies up to date[/dim]")
+            else:
+                messages.append("  [dim]Installing npm dependencies...[/dim]")
+                # npm ci requires a lockfile; fall back to npm install without one
+                npm_command = "ci" if package_lock.exists() else "install"
+                result = subprocess.run(
+                    [
+                        "npm", npm_command,
+                        "--cache", str(CACHE_DIR / "npm"),
+                        "--prefer-offline",
+                    ],
+                    cwd=repo_path,
+                    capture_output=True,
+                    text=True,
+                    timeout=120,
+                )
+                if result.returncode != 0:
+                    messages.append("  [yellow]Warning: npm install failed[/yellow]")
+                    return False
+                _record_dependencies(repo_path, "npm", key)
         except Exception:
             return False
 
@@ -138,7 +225,7 @@ def install_repo_dependencies(repo_path: Path) -> bool:
     go_mod = repo_path / "go.mod"
     if go_mod.exists():
         try:
-            console.print(f"  [dim]Downloading Go modules...[/dim]")
+            messages.append("  [dim]Downloading Go modules...[/dim]")
             subprocess.run(
                 ["go", "mod", "download"],
                 cwd=repo_path,
@@ -153,7 +240,7 @@ def install_repo_dependencies(repo_path: Path) -> bool:
     cargo_toml = repo_path / "Cargo.toml"
     if cargo_toml.exists():
         try:
-            console.print(f"  [dim]Building Rust dependencies...[/dim]")
+            messages.append("  [dim]Building Rust dependencies...[/dim]")
             subprocess.run(
                 ["cargo", "build", "--tests"],
                 cwd=repo_path,
@@ -169,7 +256,7 @@ def install_repo_dependencies(repo_path: Path) -> bool:
     java_src = repo_path / "src"
     if run_tests_sh.exists() and java_src.exists():
         try:
-            console.print(f"  [dim]Compiling Java sources...[/dim]")
+            messages.append("  [dim]Compiling Java sources...[/dim]")
             # Find all .java files and compile them
             java_files = list(java_src.rglob("*.java")) + list((repo_path / "tests").rglob("*.java")) if (repo_path / "tests").exists() else list(java_src.rglob("*.java"))
             if java_files:
@@ -186,9 +273,85 @@ def install_repo_dependencies(repo_path: Path) -> bool:
     return True
 
 
-def run_testrunner(repo_path: Path, config: dict) -> dict:
+def prepare_repo(repo: dict, test_repos_dir: Path) -> tuple[bool, list[str]]:
+    """Clone or pull a repository and install its dependencies.
+
+    Runs in a thread of the parent process, before the repo is handed to a
+    worker, so installs never run inside the worker processes.
+
+    Returns (prepared, status messages from the install step).
+    """
+    messages: list[str] = []
+    if not clone_or_pull_repo(repo, test_repos_dir):
+        return False, messages
+    install_repo_dependencies(test_repos_dir / repo["name"], messages)
+    return True, messages
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm_client(
+    provider: str,
+    base_url: str,
+    model: str,
+    timeout: int,
+    api_key: Optional[str] = None,
+):
+    """Return a process-wide LLM client so its connection pool is reused across repos.
+
+    Ollama models stay resident between requests (see OLLAMA_KEEP_ALIVE).
+    """
+    if provider == "openrouter":
+        from testrunner.llm.openrouter import OpenRouterClient
+
+        return OpenRouterClient(
+            api_key=api_key,
+            model=model,
+            base_url=base_url,
+            timeout=timeout,
+        )
+
+    from testrunner.llm.ollama import OllamaClient
+
+    return OllamaClient(
+        base_url=base_url,
+        model=model,
+        timeout=timeout,
+        keep_alive=OLLAMA_KEEP_ALIVE,
+    )
+
+
+def warm_up_ollama(config: dict) -> None:
+    """Load the Ollama model once before repos are dispatched.
+
+    Does nothing when the e2e config targets another provider.
+    """
+    if "llm" in config:
+        if config["llm"].get("provider", "ollama") != "ollama":
+            return
+        settings = config["llm"]
+    elif "ollama" in config:
+        settings = config["ollama"]
+    else:
+        return
+
+    from testrunner.llm.ollama import OllamaClient
+
+    client = OllamaClient(
+        base_url=settings.get("base_url", "http://localhost:11434"),
+        model=settings.get("model", "llama3.2"),
+        keep_alive=OLLAMA_KEEP_ALIVE,
+    )
+    console.print(f"[dim]Warming up Ollama model {client.model}...[/dim]")
+    if not client.warm_up():
+        console.print("[yellow]Warning: Ollama warm-up failed[/yellow]")
+    client.close()
+
+
+def run_testrunner(repo_path: Path, config: dict, verbose: bool = False) -> dict:
     """Run testrunner on a repository using the new architecture.
 
+    The error message only includes a full traceback when verbose is set.
+
     Uses: TestExecutor -> LLMOutputParser -> FailureAnalyzer -> ReportGenerator
 
     Returns a dict with:
@@ -237,30 +400,20 @@ def run_testrunner(repo_path: Path, config: dict) -> dict:
         load_dotenv(PROJECT_ROOT / ".env")
         load_dotenv(repo_path / ".env")
 
-        # Initialize LLM client based on provider
-        if tr_config.llm.provider == "openrouter":
-            from testrunner.llm.openrouter import OpenRouterClient
-
-            llm_client = OpenRouterClient(
-                api_key=tr_config.llm.resolve_api_key(),
-                model=tr_config.llm.model,
-                base_url=tr_config.llm.base_url,
-                timeout=tr_config.llm.timeout_seconds,
-            )
-        else:
-            from testrunner.llm.ollama import OllamaClient
-
-            llm_client = OllamaClient(
-                base_url=tr_config.llm.base_url,
-                model=tr_config.llm.model,
-                timeout=tr_config.llm.timeout_seconds,
-            )
+        llm_client = get_llm_client(
+            provider=tr_config.llm.provider,
+            base_url=tr_config.llm.base_url,
+            model=tr_config.llm.model,
+            timeout=tr_config.llm.timeout_seconds,
+            api_key=tr_config.llm.resolve_api_key(),
+        )
 
         executor = TestExecutor(
             command=tr_config.test.command,
             working_directory=paths["working_directory"],
             timeout_seconds=tr_config.test.timeout_seconds,
             environment=tr_config.test.environment,
+            log_dir=paths["report_output_dir"],
         )
         parser = LLMOutputParser(llm_client)
         analyzer = FailureAnalyzer(llm_client)
@@ -292,17 +445,30 @@ def run_testrunner(repo_path: Path, config: dict) -> dict:
             test_command=tr_config.test.command,
             language=tr_config.project.language,
             hints=hints_content,
+            log_paths=[
+                p for p in (raw_output.stdout_path, raw_output.stderr_path) if p is not None
+            ],
         )
 
-        # Build results dict
+        # Build results dict in a single pass; failed entries share the same dicts
+        results_list = []
+        failed_tests = []
+        failed_dicts = []
+        for t in parsed.tests:
+            d = t.to_dict()
+            results_list.append(d)
+            if t.status == TestStatus.FAILED:
+                failed_tests.append(t)
+                failed_dicts.append(d)
+
         results_dict = {
             "total": parsed.total,
             "passed": parsed.passed,
             "failed": parsed.failed,
             "skipped": parsed.skipped,
             "duration_ms": parsed.duration_ms,
-            "results": [t.to_dict() for t in parsed.tests],
-            "failed_tests": [t.to_dict() for t in parsed.tests if t.status == TestStatus.FAILED],
+            "results": results_list,
+            "failed_tests": failed_dicts,
             "raw_output": parsed.raw_output,
         }
 
@@ -310,8 +476,7 @@ def run_testrunner(repo_path: Path, config: dict) -> dict:
         failure_analyses = []
         if parsed.failed > 0:
             try:
-                failed_tests = [t for t in parsed.tests if t.status == TestStatus.FAILED]
-                failure_analyses = analyzer.analyze_multiple(failed_tests, git_changes, hints_content)
+                failure_analyses = analyzer.analyze_batch(failed_tests, git_changes, hints_content)
             except Exception:
                 pass
 
@@ -333,12 +498,15 @@ def run_testrunner(repo_path: Path, config: dict) -> dict:
             "passed": parsed.passed,
             "failed": parsed.failed,
             "skipped": parsed.skipped,
-            "failed_tests": [t.test_name for t in parsed.tests if t.status == TestStatus.FAILED],
+            "failed_tests": [t.test_name for t in failed_tests],
             "failure_analyses": [a.to_dict() for a in failure_analyses],
             "report_path": report_path,
         }
 
     except Exception as e:
+        if not verbose:
+            return {"success": False, "error": str(e)}
+
         import traceback
         return {"success": False, "error": f"{str(e)}\n{traceback.format_exc()}"}
 
@@ -436,6 +604,31 @@ def display_results(all_results: list[dict]) -> None:
         sys.exit(1)
 
 
+def process_repo(
+    repo: dict,
+    test_repos_dir: Path,
+    config: dict,
+    verbose: bool = False,
+) -> dict:
+    """Run testrunner for a single prepared repository.
+
+    Runs in a worker process, so it must not depend on state from the parent
+    and must not print; the parent reports the returned result.
+    Returns the run_testrunner result dict annotated with repo metadata.
+    """
+    repo_name = repo["name"]
+    repo_path = test_repos_dir / repo_name
+
+    if repo_path.exists():
+        result = run_testrunner(repo_path, config, verbose)
+    else:
+        result = {"success": False, "error": "Repository not found"}
+
+    result["repo_name"] = repo_name
+    result["expected_failures"] = repo.get("expected_failures", 0)
+    return result
+
+
 def main():
     """Main entry point."""
     console.print(Panel.fit(
@@ -443,63 +636,97 @@ def main():
         subtitle="Testing fixture repositories",
     ))
 
+    # Full tracebacks are only formatted when debugging
+    verbose = os.environ.get("TESTRUNNER_DEBUG") == "1"
+
     # Load configuration
     config = load_config()
-    console.print(f"[dim]Loaded config with {len(config['repos'])} test repos[/dim]")
+    repos = config["repos"]
+    console.print(f"[dim]Loaded config with {len(repos)} test repos[/dim]")
 
     # Ensure test_repos directory exists
     test_repos_dir = ensure_test_repos_dir(config)
     console.print(f"[dim]Test repos directory: {test_repos_dir}[/dim]")
 
-    # Clone/pull repositories
-    console.print("\n[bold]Step 1: Preparing test repositories[/bold]")
-    for repo in config["repos"]:
-        console.print(f"  {repo['name']}")
-        if not clone_or_pull_repo(repo, test_repos_dir):
-            console.print(f"[red]Failed to prepare {repo['name']}, skipping...[/red]")
-            continue
-
-        # Install dependencies
-        repo_path = test_repos_dir / repo["name"]
-        install_repo_dependencies(repo_path)
-
-    # Run testrunner on each repository
-    console.print("\n[bold]Step 2: Running TestRunner on each repository[/bold]")
-    all_results = []
-
-    for repo in config["repos"]:
-        repo_name = repo["name"]
-        repo_path = test_repos_dir / repo_name
-
-        if not repo_path.exists():
-            all_results.append({
-                "repo_name": repo_name,
-                "success": False,
-                "error": "Repository not found",
-                "expected_failures": repo.get("expected_failures", 0),
-            })
-            continue
-
-        console.print(f"\n  [cyan]{repo_name}[/cyan]")
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            task = progress.add_task("Running tests with LLM analysis...", total=None)
-            result = run_testrunner(repo_path, config)
-            progress.update(task, completed=True)
-
-        result["repo_name"] = repo_name
-        result["expected_failures"] = repo.get("expected_failures", 0)
-        all_results.append(result)
-
-        if result.get("success"):
-            console.print(f"    Total: {result['total']}, Passed: {result['passed']}, Failed: {result['failed']}")
-        else:
-            console.print(f"    [red]Error: {result.get('error', 'Unknown')[:200]}[/red]")
+    # Start cloning and installing straight away; git and the package managers
+    # wait on the network, so threads are enough and they overlap with the
+    # model warm-up below.
+    clone_pool = ThreadPoolExecutor(max_workers=8)
+    clone_futures = {
+        clone_pool.submit(prepare_repo, repo, test_repos_dir): repo
+        for repo in repos
+    }
+
+    # Load the model once so no worker pays the cold-start cost
+    warm_up_ollama(config)
+
+    # Each repo is independent and I/O-bound (test commands, LLM HTTP), so run
+    # them in parallel as soon as each repo is prepared. Use spawn so no HTTP
+    # client or lock state is inherited across a fork.
+    max_workers = max(1, min(len(repos), (os.cpu_count() or 1) - 2))
+    console.print(
+        f"\n[bold]Preparing and running TestRunner on each repository "
+        f"({max_workers} workers)[/bold]"
+    )
+    results_by_name: dict[str, dict] = {}
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+        transient=True,
+    ) as progress:
+        task = progress.add_task("Running tests with LLM analysis...", total=len(repos))
+        with clone_pool, ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = {}
+            for clone_future in as_completed(clone_futures):
+                repo = clone_futures[clone_future]
+                try:
+                    prepared, messages = clone_future.result()
+                except Exception:
+                    prepared, messages = False, []
+                for message in messages:
+                    progress.console.print(f"  {repo['name']}: {message.strip()}")
+                if not prepared:
+                    progress.console.print(
+                        f"[red]Failed to prepare {repo['name']}, skipping...[/red]"
+                    )
+                future = pool.submit(process_repo, repo, test_repos_dir, config, verbose)
+                futures[future] = repo
+
+            for future in as_completed(futures):
+                repo = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {
+                        "repo_name": repo["name"],
+                        "success": False,
+                        "error": str(e),
+                        "expected_failures": repo.get("expected_failures", 0),
+                    }
+                results_by_name[repo["name"]] = result
+                progress.advance(task)
+
+                # Print from the parent only, so per-repo output never interleaves
+                progress.console.print(f"\n  [cyan]{result['repo_name']}[/cyan]")
+                if result.get("success"):
+                    progress.console.print(
+                        f"    Total: {result['total']}, Passed: {result['passed']}, "
+                        f"Failed: {result['failed']}"
+                    )
+                else:
+                    progress.console.print(
+                        f"    [red]Error: {result.get('error', 'Unknown')[:200]}[/red]"
+                    )
+
+    # Keep the summary in config order regardless of completion order
+    all_results = [results_by_name[repo["name"]] for repo in repos]
 
     # Display summary
     display_results(all_results)
@@ -1,6 +1,20 @@
 """Entry point for running testrunner as a module: python -m testrunner"""
 
-from testrunner.cli import main
+import sys
+
+
+def main() -> None:
+    """Run the CLI, answering a bare --version without importing click."""
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        from testrunner import __version__
+
+        print(f"testrunner, version {__version__}")
+        return
+
+    from testrunner.cli import main as cli_main
+
+    cli_main()
+
 
 if __name__ == "__main__":
     main()
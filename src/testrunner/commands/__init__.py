@@ -0,0 +1 @@
+"""CLI subcommands, each loaded on demand by the `testrunner` group."""
@@ -0,0 +1,43 @@
+"""`testrunner init` command."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from testrunner.cli import _get_console, print_banner
+
+
+@click.command()
+@click.option(
+    "--output",
+    "-o",
+    "output_path",
+    type=click.Path(path_type=Path),
+    default="testrunner.json",
+    help="Output path for configuration file",
+)
+@click.option("--force", "-f", is_flag=True, help="Overwrite existing configuration")
+@click.pass_context
+def init(ctx: click.Context, output_path: Path, force: bool) -> None:
+    """Initialize a new TestRunner configuration file."""
+    from testrunner.config import create_example_config
+
+    print_banner()
+    console = _get_console()
+
+    if output_path.exists() and not force:
+        console.print(f"[yellow]Configuration file already exists:[/yellow] {output_path}")
+        console.print("Use --force to overwrite")
+        sys.exit(1)
+
+    try:
+        create_example_config(output_path)
+        console.print(f"[green]Created configuration file:[/green] {output_path}")
+        console.print("\nNext steps:")
+        console.print("  1. Edit the configuration file for your project")
+        console.print("  2. Create a HINTS.md file with project context (optional)")
+        console.print("  3. Run [bold]testrunner run[/bold] to execute tests")
+    except OSError as e:
+        console.print(f"[red]Error creating configuration:[/red] {e}")
+        sys.exit(1)
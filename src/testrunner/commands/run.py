@@ -0,0 +1,320 @@
+"""`testrunner run` command."""
+
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from testrunner.cli import _get_console, pass_config, print_banner
+
+if TYPE_CHECKING:
+    from testrunner.config import TestRunnerConfig
+    from testrunner.llm.base import LLMClient
+
+
+@click.command()
+@click.option(
+    "--report/--no-report",
+    default=True,
+    help="Generate HTML report after tests",
+)
+@pass_config
+def run(
+    ctx: click.Context,
+    config: "TestRunnerConfig",
+    base_dir: Path,
+    paths: dict[str, Path],
+    report: bool,
+) -> None:
+    """Execute tests and analyze failures."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    print_banner()
+    console = _get_console()
+
+    verbose = ctx.obj.get("verbose", False)
+    console.print(f"[dim]Loaded config for project:[/dim] {config.project.name}")
+
+    # Import new components
+    from jinja2 import TemplateError
+
+    from testrunner.core.executor import ExecutionError, TestExecutor
+    from testrunner.llm.analyzer import FailureAnalyzer
+    from testrunner.llm.parser import LLMOutputParser
+    from testrunner.report.generator import ReportGenerator
+
+    # Initialize LLM client based on provider
+    llm_client: LLMClient
+    if config.llm.provider == "openrouter":
+        from testrunner.llm.openrouter import OpenRouterClient
+
+        llm_client = OpenRouterClient(
+            api_key=config.llm.resolve_api_key(),
+            model=config.llm.model,
+            base_url=config.llm.base_url,
+            timeout=config.llm.timeout_seconds,
+        )
+    else:
+        from testrunner.llm.ollama import OllamaClient
+
+        llm_client = OllamaClient(
+            base_url=config.llm.base_url,
+            model=config.llm.model,
+            timeout=config.llm.timeout_seconds,
+        )
+
+    # Initialize new components
+    executor = TestExecutor(
+        command=config.test.command,
+        working_directory=paths["working_directory"],
+        timeout_seconds=config.test.timeout_seconds,
+        environment=config.test.environment,
+        log_dir=paths["report_output_dir"],
+    )
+    parser = LLMOutputParser(llm_client)
+    analyzer = FailureAnalyzer(llm_client)
+
+    # Load hints file if available
+    hints_content = config.get_hints_content(base_dir)
+    if hints_content and verbose:
+        console.print(f"[dim]Loaded hints from {config.hints_file}[/dim]")
+
+    # One progress display for the whole pipeline; each phase is a task line
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        # Collect git changes if enabled
+        git_changes = None
+        if config.git.enabled:
+            task = progress.add_task("Analyzing git changes...", total=1)
+            from git.exc import GitError
+
+            from testrunner.git.diff import GitDiffAnalyzer
+
+            try:
+                git_analyzer = GitDiffAnalyzer(base_dir)
+                git_changes = git_analyzer.analyze(
+                    compare_ref=config.git.compare_ref,
+                    include_uncommitted=config.git.include_uncommitted,
+                )
+                progress.update(task, completed=True)
+                if verbose and git_changes:
+                    console.print(
+                        f"[dim]Found {len(git_changes.get('files', []))} changed files[/dim]"
+                    )
+                if git_changes and config.git.ignore_untracked:
+                    git_changes.pop("untracked_files", None)
+            except (GitError, OSError, ValueError) as e:
+                progress.update(task, completed=True)
+                console.print(f"[yellow]Warning: Git analysis failed:[/yellow] {e}")
+
+        # Execute tests
+        task = progress.add_task("Running tests...", total=1)
+        if verbose and executor.log_file("stdout"):
+            console.print(
+                f"[dim]Writing test output to {executor.log_file('stdout')} (tail -f to follow)[/dim]"
+            )
+        try:
+            raw_output = executor.execute()
+            progress.update(task, completed=True)
+
+            if verbose:
+                console.print(f"[dim]Test execution completed in {raw_output.duration_ms}ms[/dim]")
+        except (ExecutionError, OSError) as e:
+            progress.update(task, completed=True)
+            console.print(f"[red]Error executing tests:[/red] {e}")
+            sys.exit(1)
+
+        # Parse test output
+        task = progress.add_task("Parsing test results...", total=1)
+        try:
+            parsed = parser.parse(
+                stdout=raw_output.stdout,
+                stderr=raw_output.stderr,
+                exit_code=raw_output.exit_code,
+                test_command=config.test.command,
+                language=config.project.language,
+                hints=hints_content,
+                log_paths=[
+                    p for p in (raw_output.stdout_path, raw_output.stderr_path) if p is not None
+                ],
+            )
+            progress.update(task, completed=True)
+
+            if verbose:
+                console.print(
+                    f"[dim]Parsed {len(parsed.tests)} tests (confidence: {parsed.parse_confidence:.0%})[/dim]"
+                )
+                if llm_client.last_raw_content:
+                    console.print("\n[bold]LLM Parser Response:[/bold]")
+                    _print_llm_response(llm_client.last_raw_content)
+        except (OSError, ValueError) as e:
+            progress.update(task, completed=True)
+            console.print(f"[red]Error parsing test output:[/red] {e}")
+            sys.exit(1)
+
+        from testrunner.storage.models import TestStatus
+
+        # Failed tests feed the analyzer and the summary preview; the full
+        # serialized list is only needed when a report will be generated.
+        all_dicts = []
+        failed_tests = []
+        FAILED = TestStatus.FAILED
+        for t in parsed.tests:
+            if t.status is FAILED:
+                failed_tests.append(t)
+            if report:
+                all_dicts.append(t.to_dict())
+
+        # Display results summary
+        results_dict: dict[str, Any] = {
+            "total": parsed.total,
+            "passed": parsed.passed,
+            "failed": parsed.failed,
+            "skipped": parsed.skipped,
+        }
+        _display_results_summary(
+            results_dict,
+            failed_preview=[t.test_name for t in failed_tests[:10]],
+            failed_count=len(failed_tests),
+        )
+        if report:
+            results_dict["duration_ms"] = parsed.duration_ms
+            results_dict["results"] = all_dicts
+            results_dict["raw_output"] = parsed.raw_output
+
+        # Analyze failures
+        failure_analyses = []
+        if parsed.failed > 0:
+            task = progress.add_task(f"Analyzing {parsed.failed} failures...", total=1)
+            try:
+                failure_analyses = analyzer.analyze_multiple(
+                    failed_tests, git_changes, hints_content
+                )
+                progress.update(task, completed=True)
+
+                if verbose:
+                    console.print(f"[dim]Generated {len(failure_analyses)} failure analyses[/dim]")
+                    # Show the LLM response behind each analysis. Analyses run
+                    # concurrently, so the client's response_log is in completion
+                    # order; each analysis carries its own response instead.
+                    for analysis in failure_analyses:
+                        if analysis.raw_response is None:
+                            continue
+                        console.print(f"\n[bold]LLM Analysis — {analysis.test_name}:[/bold]")
+                        _print_llm_response(json.dumps(analysis.raw_response, indent=2))
+            except (RuntimeError, ValueError) as e:
+                progress.update(task, completed=True)
+                console.print(f"[yellow]Warning: Failure analysis failed:[/yellow] {e}")
+
+    # Generate report
+    if report:
+        console.print("\n[bold]Generating report...[/bold]")
+        try:
+            report_gen = ReportGenerator(config, base_dir)
+            analysis_data = {
+                "git_changes": git_changes,
+                "failure_analyses": [a.to_dict() for a in failure_analyses],
+            }
+            report_path = report_gen.generate(results_dict, analysis_data)
+            console.print(f"[green]Report generated:[/green] {report_path}")
+        except (OSError, TemplateError, ValueError) as e:
+            console.print(f"[red]Error generating report:[/red] {e}")
+
+    # Exit with appropriate code
+    if parsed.failed > 0:
+        sys.exit(1)
+
+
+def _print_llm_response(content: str) -> None:
+    """Print a raw LLM response, boxed on a terminal and as plain text otherwise."""
+    console = _get_console()
+    if not console.is_terminal:
+        click.echo(content)
+        return
+
+    from rich.panel import Panel
+    from rich.text import Text
+
+    # Text skips markup parsing, so brackets in the response render as-is
+    console.print(Panel(Text(content), border_style="dim", expand=False))
+
+
+def _display_results_summary(
+    results: dict[str, Any],
+    failed_preview: Sequence[str] = (),
+    failed_count: int = 0,
+) -> None:
+    """Display a summary of test results.
+
+    Renders a rich table on a terminal and plain text otherwise (CI logs, pipes).
+
+    Args:
+        results: Summary counts (total, passed, failed, skipped)
+        failed_preview: Names of the first failed tests to list
+        failed_count: Number of failed tests found, for the "... and N more" line
+    """
+    console = _get_console()
+    total = results.get("total", 0)
+    passed = results.get("passed", 0)
+    failed = results.get("failed", 0)
+    skipped = results.get("skipped", 0)
+
+    rows = [
+        ("Total Tests", str(total), str(total)),
+        ("Passed", str(passed), f"[green]{passed}[/green]"),
+        ("Failed", str(failed), f"[red]{failed}[/red]"),
+        ("Skipped", str(skipped), f"[yellow]{skipped}[/yellow]"),
+    ]
+    if total > 0:
+        pass_rate = f"{(passed / total) * 100:.1f}%"
+        rows.append(("Pass Rate", pass_rate, pass_rate))
+
+    more = failed_count - len(failed_preview)
+
+    if not console.is_terminal:
+        lines = ["", "=" * 50, "Test Results Summary", "=" * 50]
+        lines.extend(f" {label:<12} {value:>6}" for label, value, _ in rows)
+        if failed > 0:
+            lines.extend(["", "Some tests failed!"])
+            if failed_preview:
+                lines.extend(["", "Failed tests:"])
+                lines.extend(f"  ✗ {name}" for name in failed_preview)
+                if more > 0:
+                    lines.append(f"  ... and {more} more")
+        else:
+            lines.extend(["", "All tests passed!"])
+        click.echo("\n".join(lines))
+        return
+
+    from rich.markup import escape
+    from rich.table import Table
+
+    console.print("\n" + "=" * 50)
+    console.print("[bold]Test Results Summary[/bold]")
+    console.print("=" * 50)
+
+    table = Table(show_header=False, box=None)
+    table.add_column("Metric", style="bold")
+    table.add_column("Value", justify="right")
+
+    for label, _, styled in rows:
+        table.add_row(label, styled)
+
+    console.print(table)
+
+    if failed > 0:
+        console.print("\n[red]Some tests failed![/red]")
+        if failed_preview:
+            console.print("\nFailed tests:")
+            for name in failed_preview:
+                console.print(f"  [red]✗[/red] {escape(name)}")
+            if more > 0:
+                console.print(f"  ... and {more} more")
+    else:
+        console.print("\n[green]All tests passed![/green]")
@@ -1,18 +1,26 @@
 """Configuration management for TestRunner."""
 
+import functools
 import json
 import os
 from pathlib import Path
-from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON when writing config files
+    orjson = None  # type: ignore[assignment]
+
+# Supported LLM providers (lowercase)
+_ALLOWED_PROVIDERS = frozenset({"ollama", "openrouter"})
 
 
 class ProjectConfig(BaseModel):
     """Project identification and metadata."""
 
     name: str = Field(description="Project name for identification")
-    language: Optional[str] = Field(default=None, description="Programming language hint for LLM (optional)")
+    language: str | None = Field(default=None, description="Programming language hint for LLM (optional)")
     description: str = Field(default="", description="Brief description for LLM context")
 
 
@@ -48,7 +56,7 @@ class LLMConfig(BaseModel):
         default="http://localhost:11434", description="LLM service base URL"
     )
     timeout_seconds: int = Field(default=120, description="LLM request timeout")
-    api_key_env: Optional[str] = Field(
+    api_key_env: str | None = Field(
         default=None,
         description="Environment variable name containing the API key (e.g. OPENROUTER_API_KEY)",
     )
@@ -56,12 +64,12 @@ class LLMConfig(BaseModel):
     @field_validator("provider")
     @classmethod
     def validate_provider(cls, v: str) -> str:
-        allowed = {"ollama", "openrouter"}
-        if v.lower() not in allowed:
-            raise ValueError(f"Provider must be one of: {allowed}")
-        return v.lower()
+        provider = v.lower()
+        if provider not in _ALLOWED_PROVIDERS:
+            raise ValueError(f"Provider must be one of: {', '.join(sorted(_ALLOWED_PROVIDERS))}")
+        return provider
 
-    def resolve_api_key(self) -> Optional[str]:
+    def resolve_api_key(self) -> str | None:
         """Resolve the API key from environment variables.
 
         The .env file is loaded at CLI startup via python-dotenv,
@@ -114,6 +122,9 @@ class TestRunnerConfig(BaseModel):
     report: ReportConfig = Field(default_factory=ReportConfig)
     git: GitConfig = Field(default_factory=GitConfig)
 
+    # Hints file contents keyed by path; the file is static for a run
+    _hints_cache: dict[str, str | None] = PrivateAttr(default_factory=dict)
+
     @classmethod
     def from_file(cls, path: Path | str) -> "TestRunnerConfig":
         """Load configuration from a JSON file."""
@@ -121,73 +132,144 @@ class TestRunnerConfig(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {path}")
 
-        with open(path, "r") as f:
-            data = json.load(f)
-
-        return cls.model_validate(data)
+        # pydantic-core parses and validates the raw bytes in one pass
+        return cls.model_validate_json(path.read_bytes())
 
     @classmethod
-    def find_and_load(cls, start_dir: Path | str | None = None) -> "TestRunnerConfig":
-        """Find and load configuration file, searching up the directory tree."""
-        if start_dir is None:
-            start_dir = Path.cwd()
-        else:
-            start_dir = Path(start_dir)
+    def from_file_cached(cls, path: Path | str) -> "TestRunnerConfig":
+        """Load configuration from a JSON file, reusing a cached parse if unchanged.
 
-        config_names = ["testrunner.json", ".testrunner.json"]
+        The parsed config is cached in-process, keyed on the file's path, mtime
+        and size, so repeated loads skip reading the file until it changes.
+        """
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {path}")
 
-        # Search up the directory tree
-        current = start_dir.resolve()
-        while current != current.parent:
-            for name in config_names:
-                config_path = current / name
-                if config_path.exists():
-                    return cls.from_file(config_path)
-            current = current.parent
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        # Hand out a copy so callers can't mutate the cached instance
+        return _load_config_for_key(key).model_copy(deep=True)
 
-        # Check root as well
-        for name in config_names:
-            config_path = current / name
-            if config_path.exists():
-                return cls.from_file(config_path)
+    @classmethod
+    def find_config_file(cls, start_dir: Path | str | None = None) -> Path:
+        """Find the configuration file, searching up the directory tree."""
+        # Walk parents as strings: abspath is pure string work, unlike resolve()
+        current = os.path.abspath(start_dir) if start_dir is not None else os.getcwd()
+        config_names = ("testrunner.json", ".testrunner.json")
+
+        while True:
+            # One directory listing per level instead of a stat per candidate name
+            try:
+                with os.scandir(current) as entries:
+                    names = {e.name for e in entries if e.name in config_names and not e.is_dir()}
+            except OSError:
+                names = set()
+            for name in config_names:
+                if name in names:
+                    return Path(current, name)
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            current = parent
 
         raise FileNotFoundError(
-            f"No configuration file found. Create testrunner.json or run 'testrunner init'"
+            "No configuration file found. Create testrunner.json or run 'testrunner init'"
         )
 
+    @classmethod
+    def find_and_load(cls, start_dir: Path | str | None = None) -> "TestRunnerConfig":
+        """Find and load configuration file, searching up the directory tree.
+
+        Loading goes through from_file_cached, so repeated calls for an
+        unchanged file skip parsing and validation.
+        """
+        return cls.from_file_cached(cls.find_config_file(start_dir))
+
     def to_file(self, path: Path | str) -> None:
         """Save configuration to a JSON file."""
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(self.model_dump(), option=orjson.OPT_INDENT_2))
+            return
+
         with open(path, "w") as f:
             json.dump(self.model_dump(), f, indent=2)
 
-    def get_hints_content(self, base_dir: Path | str | None = None) -> Optional[str]:
-        """Read and return the hints file content if it exists."""
+    def get_hints_content(self, base_dir: Path | str | None = None) -> str | None:
+        """Read and return the hints file content if it exists.
+
+        The result is cached per hints path, so repeated calls don't hit the disk.
+        """
         if base_dir is None:
             base_dir = Path.cwd()
         else:
             base_dir = Path(base_dir)
 
         hints_path = base_dir / self.hints_file
-        if hints_path.exists():
-            return hints_path.read_text()
-        return None
+        key = str(hints_path)
+        if key not in self._hints_cache:
+            try:
+                self._hints_cache[key] = hints_path.read_bytes().decode("utf-8")
+            except FileNotFoundError:
+                self._hints_cache[key] = None
+        return self._hints_cache[key]
+
+    def get_absolute_paths(
+        self, base_dir: Path | str | None = None, *, canonical: bool = False
+    ) -> dict[str, Path]:
+        """Get absolute paths for various config paths.
+
+        Args:
+            base_dir: Directory the configured paths are relative to (default: cwd)
+            canonical: Resolve symlinks as well; otherwise paths are only made
+                absolute and normalized, without touching the filesystem
+
+        Results are cached on the input strings, so repeated calls with the
+        same base directory and settings return immediately.
+        """
+        base_dir = os.path.abspath(os.getcwd() if base_dir is None else base_dir)
+        return dict(
+            _resolve_paths(
+                base_dir,
+                self.test.working_directory,
+                self.hints_file,
+                self.report.output_dir,
+                canonical,
+            )
+        )
 
-    def get_absolute_paths(self, base_dir: Path | str | None = None) -> dict[str, Path]:
-        """Get absolute paths for various config paths."""
-        if base_dir is None:
-            base_dir = Path.cwd()
-        else:
-            base_dir = Path(base_dir)
 
+@functools.lru_cache(maxsize=4)
+def _resolve_paths(
+    base_dir: str, working_directory: str, hints_file: str, report_dir: str, canonical: bool
+) -> dict[str, Path]:
+    """Make the configured paths absolute against an absolute base directory."""
+    if canonical:
+        base = Path(base_dir)
         return {
-            "working_directory": (base_dir / self.test.working_directory).resolve(),
-            "hints_file": (base_dir / self.hints_file).resolve(),
-            "report_output_dir": (base_dir / self.report.output_dir).resolve(),
+            "working_directory": (base / working_directory).resolve(),
+            "hints_file": (base / hints_file).resolve(),
+            "report_output_dir": (base / report_dir).resolve(),
         }
 
+    join = os.path.join
+    norm = os.path.normpath
+    return {
+        "working_directory": Path(norm(join(base_dir, working_directory))),
+        "hints_file": Path(norm(join(base_dir, hints_file))),
+        "report_output_dir": Path(norm(join(base_dir, report_dir))),
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_for_key(key: tuple[str, int, int]) -> TestRunnerConfig:
+    """Load a config for a (path, mtime_ns, size) key."""
+    return TestRunnerConfig.from_file(key[0])
+
 
 def get_default_config() -> TestRunnerConfig:
     """Return a default configuration."""
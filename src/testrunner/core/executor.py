@@ -5,22 +5,36 @@ any test command and captures its output, without framework-specific logic.
 """
 
 import os
+import shlex
 import subprocess
+import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import IO, Any
+
+from testrunner.core.fs import ensure_dir
+
+# Characters that need /bin/sh to interpret (pipes, redirects, globs, expansion...)
+_SHELL_CHARS = frozenset("|&;<>$`*?(){}[]~#!\n")
 
 
 @dataclass
 class RawTestOutput:
-    """Raw output from test command execution."""
+    """Raw output from test command execution.
+
+    stdout and stderr hold at most the last ``max_output_bytes`` of each stream;
+    when the executor was given a log directory the full streams are on disk at
+    stdout_path / stderr_path.
+    """
 
     stdout: str
     stderr: str
     exit_code: int
     duration_ms: int
     command: str
+    stdout_path: Path | None = None
+    stderr_path: Path | None = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary format."""
@@ -30,6 +44,8 @@ class RawTestOutput:
             "exit_code": self.exit_code,
             "duration_ms": self.duration_ms,
             "command": self.command,
+            "stdout_path": str(self.stdout_path) if self.stdout_path else None,
+            "stderr_path": str(self.stderr_path) if self.stderr_path else None,
         }
 
 
@@ -41,7 +57,9 @@ class TestExecutor:
         command: str,
         working_directory: Path,
         timeout_seconds: int = 300,
-        environment: Optional[dict[str, str]] = None,
+        environment: dict[str, str] | None = None,
+        log_dir: Path | None = None,
+        max_output_bytes: int = 65536,
     ):
         """Initialize test executor.
 
@@ -50,62 +68,72 @@ class TestExecutor:
             working_directory: Directory to run command in
             timeout_seconds: Maximum time to allow for execution
             environment: Additional environment variables to set
+            log_dir: Directory to keep the full stdout/stderr logs in (temporary files if None)
+            max_output_bytes: Maximum bytes of each stream kept in memory (tail is kept)
         """
         self.command = command
         self.working_directory = working_directory
         self.timeout_seconds = timeout_seconds
         self.environment = environment or {}
+        self.log_dir = Path(log_dir) if log_dir else None
+        self.max_output_bytes = max_output_bytes
+        self._argv = _split_command(command)
+        self.refresh_env()
+
+    def refresh_env(self) -> None:
+        """Rebuild the child environment from os.environ and the configured variables.
+
+        The merged environment is computed once at construction; call this if
+        os.environ or self.environment change before the next execute().
+        """
+        # None lets the child inherit os.environ without copying it
+        self._env = {**os.environ, **self.environment} if self.environment else None
 
     def execute(self) -> RawTestOutput:
         """Execute the test command and capture output.
 
+        Output is streamed straight to files rather than buffered in pipes, so
+        memory stays bounded no matter how much the test command prints.
+
         Returns:
             RawTestOutput with stdout, stderr, exit code, and duration
-
-        Raises:
-            subprocess.TimeoutExpired: If execution exceeds timeout
-            subprocess.CalledProcessError: If command fails to run
         """
-        # Build environment
-        env = {**os.environ, **self.environment}
-
         # Record start time
         start_time = time.time()
 
         try:
-            # Run command with shell=True to support complex commands
-            result = subprocess.run(
-                self.command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                cwd=self.working_directory,
-                timeout=self.timeout_seconds,
-                env=env,
-            )
-
-            # Calculate duration
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            return RawTestOutput(
-                stdout=result.stdout,
-                stderr=result.stderr,
-                exit_code=result.returncode,
-                duration_ms=duration_ms,
-                command=self.command,
-            )
-
-        except subprocess.TimeoutExpired:
-            # Execution timed out
-            duration_ms = self.timeout_seconds * 1000
-
-            return RawTestOutput(
-                stdout="",
-                stderr=f"Test execution timed out after {self.timeout_seconds} seconds",
-                exit_code=-1,
-                duration_ms=duration_ms,
-                command=self.command,
-            )
+            with self._open_log("stdout") as stdout_file, self._open_log("stderr") as stderr_file:
+                process = self._spawn(stdout_file, stderr_file)
+
+                try:
+                    exit_code = process.wait(timeout=self.timeout_seconds)
+                except subprocess.TimeoutExpired:
+                    # Execution timed out
+                    process.kill()
+                    process.wait()
+
+                    return RawTestOutput(
+                        stdout="",
+                        stderr=f"Test execution timed out after {self.timeout_seconds} seconds",
+                        exit_code=-1,
+                        duration_ms=self.timeout_seconds * 1000,
+                        command=self.command,
+                        stdout_path=self._log_path(stdout_file),
+                        stderr_path=self._log_path(stderr_file),
+                    )
+
+                # Calculate duration
+                duration_ms = int((time.time() - start_time) * 1000)
+
+                return RawTestOutput(
+                    stdout=self._read_tail(stdout_file),
+                    stderr=self._read_tail(stderr_file),
+                    exit_code=exit_code,
+                    duration_ms=duration_ms,
+                    command=self.command,
+                    stdout_path=self._log_path(stdout_file),
+                    stderr_path=self._log_path(stderr_file),
+                )
 
         except Exception as e:
             # Other execution errors
@@ -119,8 +147,79 @@ class TestExecutor:
                 command=self.command,
             )
 
+    def _spawn(self, stdout_file: IO[bytes], stderr_file: IO[bytes]) -> subprocess.Popen[bytes]:
+        """Start the test command, skipping /bin/sh when it uses no shell features."""
+        kwargs: dict[str, Any] = {
+            "stdout": stdout_file,
+            "stderr": stderr_file,
+            "cwd": self.working_directory,
+            "env": self._env,
+        }
+        if self._argv is not None:
+            try:
+                return subprocess.Popen(self._argv, **kwargs)
+            except FileNotFoundError:
+                # Not an executable on PATH (e.g. a shell builtin); let the shell handle it
+                pass
+        return subprocess.Popen(self.command, shell=True, **kwargs)
+
+    def log_file(self, stream: str) -> Path | None:
+        """Return the file a stream ("stdout" or "stderr") is logged to.
+
+        The file is written while the command runs, so it can be followed
+        live (e.g. with `tail -f`). Returns None when no log_dir is set.
+        """
+        if self.log_dir is None:
+            return None
+        return self.log_dir / f"test_{stream}.log"
+
+    def _open_log(self, stream: str) -> IO[bytes]:
+        """Open the file a stream is written to."""
+        log_file = self.log_file(stream)
+        if log_file is None:
+            return tempfile.TemporaryFile()
+
+        ensure_dir(log_file.parent)
+        return open(log_file, "w+b")
+
+    def _log_path(self, log_file: IO[bytes]) -> Path | None:
+        """Return the on-disk path of a persisted log, if any."""
+        return Path(log_file.name) if self.log_dir is not None else None
+
+    def _read_tail(self, log_file: IO[bytes]) -> str:
+        """Read at most max_output_bytes from the end of a log file."""
+        size = log_file.seek(0, os.SEEK_END)
+        truncated = size > self.max_output_bytes
+        log_file.seek(size - self.max_output_bytes if truncated else 0)
+        data = log_file.read()
+        if not truncated:
+            return data.decode("utf-8", errors="replace")
+
+        # Skip UTF-8 continuation bytes left over from cutting into a character
+        start = 0
+        while start < min(3, len(data)) and 0x80 <= data[start] <= 0xBF:
+            start += 1
+        return "... (earlier output truncated)\n" + data[start:].decode("utf-8", errors="replace")
+
 
 class ExecutionError(Exception):
     """Raised when test execution fails."""
 
     pass
+
+
+def _split_command(command: str) -> list[str] | None:
+    """Split a command into argv if it can run without a shell.
+
+    Returns None when the command needs /bin/sh: shell operators or
+    expansions, leading VAR=value assignments, or quoting shlex can't parse.
+    """
+    if _SHELL_CHARS.intersection(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
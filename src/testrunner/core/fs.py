@@ -0,0 +1,24 @@
+"""Filesystem helpers shared across the runner."""
+
+from pathlib import Path
+
+# Directories already created by this process
+_ensured_dirs: set[Path] = set()
+
+
+def ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) once per process.
+
+    The report directory is requested by the CLI, the executor and the report
+    generator on every run; after the first call the mkdir is skipped.
+
+    Args:
+        path: Directory to create
+
+    Returns:
+        The same path
+    """
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+    return path
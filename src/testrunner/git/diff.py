@@ -1,15 +1,23 @@
 """Git diff analysis for identifying changed files and code."""
 
+import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
-import git
 from git import Repo
 from git.exc import InvalidGitRepositoryError, GitCommandError
 
+try:
+    import pygit2
+except ImportError:  # optional: libgit2 fast path for committed diffs
+    pygit2 = None  # type: ignore[assignment]
 
-@dataclass
+# Separates commits in `git log -z` output; can't appear in hashes or names
+_LOG_RECORD = "\x1e"
+
+
+@dataclass(slots=True)
 class ChangedFile:
     """Represents a changed file in a git diff."""
 
@@ -29,7 +37,7 @@ class ChangedFile:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitInfo:
     """Information about a commit."""
 
@@ -115,7 +123,7 @@ class GitDiffAnalyzer:
         try:
             committed_files = self._get_committed_changes(compare_ref)
             result["files"].extend(committed_files)
-        except GitCommandError as e:
+        except GitCommandError:
             # Reference might not exist (e.g., not enough commits)
             pass
 
@@ -123,9 +131,10 @@ class GitDiffAnalyzer:
         if include_uncommitted:
             uncommitted_files, untracked_files = self._get_uncommitted_changes()
             # Merge with committed changes, avoiding duplicates
-            existing_paths = {f["path"] for f in result["files"]}
+            seen = {f["path"] for f in result["files"]}
             for f in uncommitted_files:
-                if f["path"] not in existing_paths:
+                if f["path"] not in seen:
+                    seen.add(f["path"])
                     result["files"].append(f)
             result["untracked_files"] = untracked_files
 
@@ -149,35 +158,70 @@ class GitDiffAnalyzer:
 
     def _get_committed_changes(self, compare_ref: str) -> list[dict]:
         """Get changes between HEAD and compare_ref."""
+        if pygit2 is not None:
+            files = self._get_committed_changes_pygit2(compare_ref)
+            if files is not None:
+                return files
+
         files = []
 
         try:
-            # Get the diff between HEAD and compare_ref
-            diff = self.repo.head.commit.diff(compare_ref)
-
-            for d in diff:
-                change_type = d.change_type
-                path = d.b_path if d.b_path else d.a_path
-
-                # Get diff content
-                diff_content = ""
-                try:
-                    diff_content = d.diff.decode("utf-8", errors="replace") if d.diff else ""
-                except Exception:
-                    pass
-
+            # Diff compare_ref against HEAD (a=compare_ref, b=HEAD) in one git call,
+            # so change types and line counts both describe compare_ref -> HEAD
+            raw = self._git(
+                "diff-tree", "-r", "-M", "--raw", "--numstat", "-z", compare_ref, "HEAD", "--"
+            )
+            for change_type, path, additions, deletions in _parse_raw_diff(raw):
                 changed_file = ChangedFile(
                     path=path,
                     change_type=change_type,
-                    diff_content=diff_content,
+                    additions=additions,
+                    deletions=deletions,
                 )
                 files.append(changed_file.to_dict())
-
         except Exception:
             pass
 
         return files
 
+    def _get_committed_changes_pygit2(self, compare_ref: str) -> Optional[list[dict]]:
+        """Get changes between HEAD and compare_ref in-process via libgit2.
+
+        Produces the same entries as the git subprocess path without spawning
+        git, including rename detection and per-file line counts.
+
+        Returns:
+            List of changed files, or None if the fast path could not be used
+        """
+        try:
+            repo_dir = pygit2.discover_repository(str(self.repo_path))
+            if repo_dir is None:
+                return None
+            repo = pygit2.Repository(repo_dir)
+            head = repo.head.peel(pygit2.Commit)
+            other = repo.revparse_single(compare_ref).peel(pygit2.Commit)
+        except Exception:
+            return None
+
+        diff = repo.diff(other, head)
+        diff.find_similar()
+
+        files = []
+        for patch in diff:
+            if patch is None:
+                continue
+            delta = patch.delta
+            _, additions, deletions = patch.line_stats
+            changed_file = ChangedFile(
+                path=delta.new_file.path or delta.old_file.path,
+                change_type=delta.status_char(),
+                additions=additions,
+                deletions=deletions,
+            )
+            files.append(changed_file.to_dict())
+
+        return files
+
     def _get_uncommitted_changes(self) -> tuple[list[dict], list[dict]]:
         """Get uncommitted changes (staged and unstaged) and untracked files.
 
@@ -185,30 +229,36 @@ class GitDiffAnalyzer:
             Tuple of (changed_files, untracked_files)
         """
         files = []
+        seen: set[str] = set()
 
-        # Staged changes
+        # Staged changes (a=HEAD, b=index)
         try:
-            staged = self.repo.index.diff("HEAD")
-            for d in staged:
-                path = d.b_path if d.b_path else d.a_path
+            raw = self._git(
+                "diff-index", "--cached", "-M", "--raw", "--numstat", "-z", "HEAD", "--"
+            )
+            for change_type, path, additions, deletions in _parse_raw_diff(raw):
+                seen.add(path)
                 changed_file = ChangedFile(
                     path=path,
-                    change_type=d.change_type,
+                    change_type=change_type,
+                    additions=additions,
+                    deletions=deletions,
                 )
                 files.append(changed_file.to_dict())
         except Exception:
             pass
 
-        # Unstaged changes
+        # Unstaged changes (a=index, b=working tree), skipping paths already staged
         try:
-            unstaged = self.repo.index.diff(None)
-            existing_paths = {f["path"] for f in files}
-            for d in unstaged:
-                path = d.b_path if d.b_path else d.a_path
-                if path not in existing_paths:
+            raw = self._git("diff-files", "-M", "--raw", "--numstat", "-z", "--")
+            for change_type, path, additions, deletions in _parse_raw_diff(raw):
+                if path not in seen:
+                    seen.add(path)
                     changed_file = ChangedFile(
                         path=path,
-                        change_type=d.change_type,
+                        change_type=change_type,
+                        additions=additions,
+                        deletions=deletions,
                     )
                     files.append(changed_file.to_dict())
         except Exception:
@@ -217,55 +267,76 @@ class GitDiffAnalyzer:
         # Untracked files (separate from changed files)
         untracked = []
         try:
-            for path in self.repo.untracked_files:
-                changed_file = ChangedFile(
-                    path=path,
-                    change_type="U",
-                )
-                untracked.append(changed_file.to_dict())
+            raw = self._git("ls-files", "--others", "--exclude-standard", "-z")
+            for path in raw.decode("utf-8", errors="replace").split("\0"):
+                if path:
+                    untracked.append(ChangedFile(path=path, change_type="U").to_dict())
         except Exception:
             pass
 
         return files, untracked
 
+    def _git(self, *args: str) -> bytes:
+        """Run a git command in the repository and return its raw stdout.
+
+        Raises:
+            subprocess.CalledProcessError: If git exits with an error
+        """
+        # Run from the work tree root so paths are root-relative, as GitPython reports them
+        result = subprocess.run(
+            ["git", *args],
+            cwd=self.repo.working_tree_dir or self.repo_path,
+            capture_output=True,
+            check=True,
+        )
+        return result.stdout
+
     def _get_recent_commits(self, compare_ref: str) -> list[dict]:
-        """Get recent commits since compare_ref."""
-        commits = []
+        """Get recent commits since compare_ref.
 
-        try:
-            # Parse the compare_ref to handle HEAD~N format
-            if compare_ref.startswith("HEAD~"):
-                try:
-                    n = int(compare_ref[5:])
-                    commit_list = list(self.repo.iter_commits("HEAD", max_count=n))
-                except ValueError:
-                    commit_list = list(self.repo.iter_commits(f"{compare_ref}..HEAD"))
-            else:
-                commit_list = list(self.repo.iter_commits(f"{compare_ref}..HEAD"))
-
-            for commit in commit_list:
-                files_changed = []
-                try:
-                    if commit.parents:
-                        diff = commit.diff(commit.parents[0])
-                        files_changed = [
-                            d.b_path if d.b_path else d.a_path for d in diff
-                        ]
-                except Exception:
-                    pass
+        Commits and the files each one touched come from a single `git log`
+        call. File lists are diffed against the first parent in the same
+        direction GitPython's commit.diff(parent) uses; root commits list none.
+        """
+        commits: list[dict[str, Any]] = []
 
-                commit_info = CommitInfo(
-                    hash=commit.hexsha,
-                    short_hash=commit.hexsha[:8],
-                    message=commit.message.strip(),
-                    author=str(commit.author),
-                    date=commit.committed_datetime.isoformat(),
-                    files_changed=files_changed,
-                )
-                commits.append(commit_info.to_dict())
+        # Parse the compare_ref to handle HEAD~N format
+        revision = [f"{compare_ref}..HEAD"]
+        if compare_ref.startswith("HEAD~"):
+            try:
+                revision = ["-n", str(int(compare_ref[5:])), "HEAD"]
+            except ValueError:
+                pass
 
+        try:
+            raw = self._git(
+                "-c", "log.showRoot=false",
+                "log", "-R", "-M", "--raw", "-z", "--no-abbrev",
+                "--diff-merges=first-parent",
+                f"--format={_LOG_RECORD}%H%x00%an%x00%cI%x00%B",
+                *revision, "--",
+            )
         except Exception:
-            pass
+            return commits
+
+        for record in raw.decode("utf-8", errors="replace").split(_LOG_RECORD)[1:]:
+            fields = record.split("\0")
+            if len(fields) < 4:
+                continue
+            sha, author, date, message = fields[:4]
+            # The raw diff entries follow the message after a newline
+            if len(fields) > 4:
+                fields[4] = fields[4].lstrip("\n")
+
+            commit_info = CommitInfo(
+                hash=sha,
+                short_hash=sha[:8],
+                message=message.strip(),
+                author=author,
+                date=date,
+                files_changed=[path for _, path in _parse_raw_fields(fields[4:])[0]],
+            )
+            commits.append(commit_info.to_dict())
 
         return commits
 
@@ -305,3 +376,52 @@ class GitDiffAnalyzer:
             pass
 
         return blame_info
+
+
+def _parse_raw_diff(raw: bytes) -> list[tuple[str, str, int, int]]:
+    """Parse `git diff --raw --numstat -z` output.
+
+    For renames and copies the destination (b side) path is reported,
+    matching GitPython's `b_path or a_path`. Binary files count as 0 lines.
+
+    Returns:
+        List of (change_type, path, additions, deletions)
+    """
+    fields = raw.decode("utf-8", errors="replace").split("\0")
+    entries, i = _parse_raw_fields(fields)
+
+    # --numstat lists the same files in the same order after the raw entries
+    stats: list[tuple[int, int]] = []
+    while i < len(fields) and len(stats) < len(entries):
+        additions, deletions, path = fields[i].split("\t", 2)
+        # Renames leave the path empty and put both paths in the next two fields
+        i += 1 if path else 3
+        stats.append((_count(additions), _count(deletions)))
+    stats.extend([(0, 0)] * (len(entries) - len(stats)))
+
+    return [(change_type, path, *counts) for (change_type, path), counts in zip(entries, stats)]
+
+
+def _parse_raw_fields(fields: list[str]) -> tuple[list[tuple[str, str]], int]:
+    """Parse NUL-split `--raw -z` fields into (change_type, path) pairs.
+
+    Returns:
+        Tuple of (entries, index of the first field after the raw entries)
+    """
+    entries = []
+    i = 0
+    while i < len(fields) and fields[i].startswith(":"):
+        change_type = fields[i].rsplit(" ", 1)[-1][:1]
+        if change_type in ("R", "C"):
+            path = fields[i + 2]
+            i += 3
+        else:
+            path = fields[i + 1]
+            i += 2
+        entries.append((change_type, path))
+    return entries, i
+
+
+def _count(value: str) -> int:
+    """Convert a --numstat line count to int ("-" for binary files)."""
+    return int(value) if value.isdigit() else 0
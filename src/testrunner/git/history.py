@@ -1,15 +1,25 @@
 """Git history analysis for understanding code evolution."""
 
-from dataclasses import dataclass
+import functools
+import heapq
+import json
+import os
+import subprocess
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
 
 from git import Repo
 from git.exc import InvalidGitRepositoryError
 
+from testrunner.git.diff import _LOG_RECORD, _count, _parse_raw_fields
 
-@dataclass
+
+@dataclass(slots=True)
 class FileContributor:
     """Information about a file contributor."""
 
@@ -18,7 +28,7 @@ class FileContributor:
     commits: int
     lines_added: int = 0
     lines_removed: int = 0
-    last_commit_date: Optional[datetime] = None
+    last_commit_date: datetime | None = None
 
     def to_dict(self) -> dict:
         return {
@@ -39,43 +49,68 @@ class GitHistoryAnalyzer:
     def __init__(self, repo_path: Path | str):
         """Initialize with repository path."""
         self.repo_path = Path(repo_path)
-        self._repo: Optional[Repo] = None
+        self._repo: Repo | None = None
+        self._work_tree: str | None = None
 
     @property
     def repo(self) -> Repo:
         """Get the git repository."""
         if self._repo is None:
             try:
-                self._repo = Repo(self.repo_path, search_parent_directories=True)
+                self._repo = _open_repo(os.path.abspath(self.repo_path))
             except InvalidGitRepositoryError:
                 raise ValueError(f"Not a git repository: {self.repo_path}")
+            _write_commit_graph(self._repo.common_dir)
         return self._repo
 
     def get_file_contributors(self, file_path: str) -> list[FileContributor]:
-        """Get contributors for a specific file."""
-        contributors: dict[str, FileContributor] = {}
+        """Get contributors for a specific file.
 
+        Results are reused across analyzers until HEAD moves.
+        """
         try:
-            for commit in self.repo.iter_commits(paths=file_path):
-                key = commit.author.email
-                if key not in contributors:
-                    contributors[key] = FileContributor(
-                        name=commit.author.name,
-                        email=commit.author.email,
-                        commits=0,
-                    )
-
-                contributors[key].commits += 1
-                if (
-                    contributors[key].last_commit_date is None
-                    or commit.committed_datetime > contributors[key].last_commit_date
-                ):
-                    contributors[key].last_commit_date = commit.committed_datetime
+            contributors = _file_contributors(self._root(), self._head(), file_path)
+        except Exception:
+            return []
+        # The cached instances are shared, so hand out copies
+        return [replace(c) for c in contributors]
+
+    def get_file_contributors_batch(
+        self, file_paths: list[str], max_workers: int | None = None
+    ) -> dict[str, list[FileContributor]]:
+        """Get contributors for several files at once.
+
+        Each file needs its own path-limited `git log`; those run in a thread
+        pool since the time is spent waiting on git, not holding the GIL.
+        The workers only run git subprocesses; the GitPython Repo is not
+        thread-safe and stays on the calling thread.
+
+        Args:
+            file_paths: Files to look up (duplicates are looked up once)
+            max_workers: Thread count (default: 4 per CPU, at most 32)
+
+        Returns:
+            Dictionary mapping each file path to its contributors
+        """
+        paths = list(dict.fromkeys(file_paths))
+        if not paths:
+            return {}
 
+        try:
+            work_tree = self._root()
+            head = self._head()
         except Exception:
-            pass
+            return {path: [] for path in paths}
+
+        def lookup(path: str) -> list[FileContributor]:
+            try:
+                return [replace(c) for c in _file_contributors(work_tree, head, path)]
+            except Exception:
+                return []
 
-        return sorted(contributors.values(), key=lambda c: c.commits, reverse=True)
+        workers = max_workers or min(32, (os.cpu_count() or 1) * 4, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(paths, pool.map(lookup, paths)))
 
     def get_recently_modified_files(
         self, days: int = 7, limit: int = 50
@@ -85,100 +120,362 @@ class GitHistoryAnalyzer:
         files: dict[str, dict] = {}
 
         try:
-            for commit in self.repo.iter_commits(since=since):
-                if commit.parents:
-                    diff = commit.diff(commit.parents[0])
-                    for d in diff:
-                        path = d.b_path if d.b_path else d.a_path
-                        if path not in files:
-                            files[path] = {
-                                "path": path,
-                                "modifications": 0,
-                                "last_modified": commit.committed_datetime.isoformat(),
-                                "last_author": commit.author.name,
-                            }
-                        files[path]["modifications"] += 1
+            for _, name, date, paths in self._log(f"--since={since}", "HEAD"):
+                for path in paths:
+                    if path not in files:
+                        files[path] = {
+                            "path": path,
+                            "modifications": 0,
+                            "last_modified": date,
+                            "last_author": name,
+                        }
+                    files[path]["modifications"] += 1
 
         except Exception:
             pass
 
-        # Sort by modifications and return top files
-        sorted_files = sorted(
-            files.values(), key=lambda f: f["modifications"], reverse=True
-        )
-        return sorted_files[:limit]
+        # Return the most modified files (ties keep first-seen order)
+        return heapq.nlargest(limit, files.values(), key=lambda f: f["modifications"])
 
     def get_hotspot_files(self, limit: int = 20) -> list[dict]:
-        """Identify hotspot files (frequently changed files)."""
-        file_changes: dict[str, dict] = {}
+        """Identify hotspot files (frequently changed files).
 
+        Results are cached on disk until HEAD moves.
+        """
         try:
-            # Analyze last 100 commits
-            for commit in self.repo.iter_commits(max_count=100):
-                if commit.parents:
-                    diff = commit.diff(commit.parents[0])
-                    for d in diff:
-                        path = d.b_path if d.b_path else d.a_path
-                        if path not in file_changes:
-                            file_changes[path] = {
-                                "path": path,
-                                "change_count": 0,
-                                "unique_authors": set(),
-                            }
-                        file_changes[path]["change_count"] += 1
-                        file_changes[path]["unique_authors"].add(commit.author.email)
-
+            return self._cached(["hotspots", limit], lambda: self._hotspot_files(limit))
         except Exception:
-            pass
+            return []
+
+    def _hotspot_files(self, limit: int) -> list[dict]:
+        """Compute get_hotspot_files from the last 100 commits.
+
+        Raises:
+            subprocess.CalledProcessError: If git exits with an error
+        """
+        file_changes: dict[str, dict] = {}
+
+        # Analyze last 100 commits
+        for email, _, _, paths in self._log("-n", "100", "HEAD"):
+            for path in paths:
+                if path not in file_changes:
+                    file_changes[path] = {
+                        "path": path,
+                        "change_count": 0,
+                        "unique_authors": set(),
+                    }
+                file_changes[path]["change_count"] += 1
+                file_changes[path]["unique_authors"].add(email)
+
+        # Select the top files by change count (ties keep first-seen order)
+        top_files = heapq.nlargest(
+            limit, file_changes.values(), key=lambda f: f["change_count"]
+        )
 
         # Convert sets to counts
-        for f in file_changes.values():
+        for f in top_files:
             f["unique_authors"] = len(f["unique_authors"])
 
-        # Sort by change count
-        sorted_files = sorted(
-            file_changes.values(), key=lambda f: f["change_count"], reverse=True
-        )
-        return sorted_files[:limit]
+        return top_files
 
     def find_related_files(self, file_path: str, limit: int = 10) -> list[dict]:
-        """Find files that are often changed together with the given file."""
-        co_changes: dict[str, int] = {}
+        """Find files that are often changed together with the given file.
 
+        Results are cached on disk until HEAD moves.
+        """
         try:
-            # Get commits that modified the target file
-            for commit in self.repo.iter_commits(paths=file_path, max_count=50):
-                if commit.parents:
-                    diff = commit.diff(commit.parents[0])
-                    changed_files = [
-                        d.b_path if d.b_path else d.a_path for d in diff
-                    ]
-
-                    # Count co-changes with other files
-                    for other_file in changed_files:
-                        if other_file != file_path:
-                            co_changes[other_file] = co_changes.get(other_file, 0) + 1
-
+            return self._cached(
+                ["related", file_path, limit], lambda: self._related_files(file_path, limit)
+            )
         except Exception:
-            pass
-
-        # Sort by co-change frequency
-        sorted_files = sorted(co_changes.items(), key=lambda x: x[1], reverse=True)
+            return []
+
+    def _related_files(self, file_path: str, limit: int) -> list[dict]:
+        """Compute find_related_files from the last 50 commits touching file_path.
+
+        Raises:
+            subprocess.CalledProcessError: If git exits with an error
+        """
+        co_changes: Counter[str] = Counter()
+
+        # Select the commits that modified the target file first: showing
+        # merge diffs would turn off the history simplification that
+        # iter_commits(paths=...) applies. Then list all of their files.
+        shas = self._git("rev-list", "-n", "50", "HEAD", "--", file_path)
+        if shas:
+            for _, _, _, changed_files in self._log(
+                "--no-walk=unsorted", "--stdin", input=shas
+            ):
+                # Count co-changes with other files
+                co_changes.update(f for f in changed_files if f != file_path)
+
+        # Most frequent co-changes first (ties keep first-seen order)
         return [
             {"path": path, "co_change_count": count}
-            for path, count in sorted_files[:limit]
+            for path, count in co_changes.most_common(limit)
         ]
 
     def get_commit_frequency(self, days: int = 30) -> dict:
         """Get commit frequency over the specified period."""
-        frequency = {}
+        frequency: Counter[str] = Counter()
         since = datetime.now() - timedelta(days=days)
 
         try:
-            for commit in self.repo.iter_commits(since=since):
-                date_key = commit.committed_datetime.strftime("%Y-%m-%d")
-                frequency[date_key] = frequency.get(date_key, 0) + 1
+            # %cs is the committer-local calendar day, as committed_datetime.strftime gives
+            raw = self._git("log", "--format=%cs", f"--since={since}", "HEAD")
+            frequency.update(raw.decode("ascii").split())
         except Exception:
             pass
 
-        return frequency
+        return dict(frequency)
+
+    def _cached(self, key: list[object], compute: Callable[[], list[dict]]) -> list[dict]:
+        """Return compute()'s result for the current HEAD via the on-disk cache.
+
+        Entries are stored as JSON in testrunner/history.cache.json inside the
+        git directory (so the cache never shows up as an untracked file) and
+        are all dropped once HEAD moves. If compute() raises, the exception
+        propagates and nothing is cached.
+
+        Args:
+            key: Identifies the query and its arguments (JSON-serializable)
+            compute: Produces the result on a cache miss
+
+        Returns:
+            The cached or freshly computed result
+        """
+        try:
+            head = self._head()
+            cache_path = Path(self.repo.git_dir) / "testrunner" / "history.cache.json"
+        except Exception:
+            return compute()
+
+        entry_key = json.dumps(key)
+        entries: dict[str, list[dict]] = {}
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("head") == head and isinstance(cached.get("entries"), dict):
+                if entry_key in cached["entries"]:
+                    return cached["entries"][entry_key]
+                entries = cached["entries"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        result = compute()
+        entries[entry_key] = result
+
+        # Write to a temporary file first so concurrent readers never see a partial cache
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"head": head, "entries": entries}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+        return result
+
+    def _log(
+        self, *args: str, input: bytes | None = None
+    ) -> Iterator[tuple[str, str, str, list[str]]]:
+        """Walk history with a single `git log` call.
+
+        Changed files are diffed against the first parent in the direction
+        GitPython's commit.diff(parent) uses, so a renamed file is reported
+        under its old path; root commits list none.
+
+        Args:
+            *args: `git log` revisions and options (limits, --since, pathspec)
+            input: Data for git's stdin (used with --stdin)
+
+        Yields:
+            Tuples of (author_email, author_name, committer_date_iso, paths)
+
+        Raises:
+            subprocess.CalledProcessError: If git exits with an error
+        """
+        raw = self._git(
+            "-c", "log.showRoot=false",
+            "log", "-R", "-M", "--raw", "-z", "--no-abbrev", "--diff-merges=first-parent",
+            f"--format={_LOG_RECORD}%ae%x00%an%x00%cI",
+            *args,
+            input=input,
+        )
+
+        for record in raw.decode("utf-8", errors="replace").split(_LOG_RECORD)[1:]:
+            fields = record.split("\0")
+            if len(fields) < 3:
+                continue
+            email, name, date = fields[:3]
+            paths = []
+            if len(fields) > 3:
+                # The raw diff entries follow the header after a newline
+                fields[3] = fields[3].lstrip("\n")
+                paths = [path for _, path in _parse_raw_fields(fields[3:])[0]]
+            yield email, name, date, paths
+
+    def _root(self) -> str:
+        """Return the work tree root, which git commands run from.
+
+        Raises:
+            ValueError: If repo_path is not inside a git repository
+        """
+        if self._work_tree is None:
+            self._work_tree = str(self.repo.working_tree_dir or self.repo_path)
+        return self._work_tree
+
+    def _head(self) -> str:
+        """Return the commit HEAD points at.
+
+        Raises:
+            subprocess.CalledProcessError: If HEAD does not point at a commit
+        """
+        return self._git("rev-parse", "--verify", "HEAD").decode("ascii").strip()
+
+    def _git(self, *args: str, input: bytes | None = None) -> bytes:
+        """Run a git command in the repository and return its raw stdout.
+
+        Raises:
+            ValueError: If repo_path is not inside a git repository
+            subprocess.CalledProcessError: If git exits with an error
+        """
+        return _run_git(self._root(), *args, input=input)
+
+
+# Git directories whose commit-graph this process has already checked
+_graph_checked: set[str] = set()
+_graph_lock = threading.Lock()
+
+
+def _write_commit_graph(git_dir: str) -> threading.Thread | None:
+    """Write a commit-graph with changed-path filters if git_dir has none.
+
+    History walks, path-limited ones especially, read parents and changed
+    paths from the graph instead of parsing commit objects. The write runs
+    once per repository and process, in a daemon thread that waits on git so
+    the process is reaped without blocking the analysis; failures are ignored.
+
+    Returns:
+        The thread running the write, or None if no write was started
+    """
+    with _graph_lock:
+        if git_dir in _graph_checked:
+            return None
+        _graph_checked.add(git_dir)
+
+    info = Path(git_dir) / "objects" / "info"
+    if (info / "commit-graph").exists() or (info / "commit-graphs").exists():
+        return None
+
+    def write() -> None:
+        try:
+            subprocess.run(
+                ["git", "commit-graph", "write", "--reachable", "--changed-paths"],
+                cwd=git_dir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+        except OSError:
+            pass
+
+    thread = threading.Thread(target=write, name="commit-graph-write", daemon=True)
+    thread.start()
+    return thread
+
+
+def _run_git(cwd: str, *args: str, input: bytes | None = None) -> bytes:
+    """Run a git command in cwd and return its raw stdout.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with an error
+    """
+    # Run from the work tree root so paths are root-relative, as GitPython reports them
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, input=input, capture_output=True, check=True
+    )
+    return result.stdout
+
+
+@functools.lru_cache(maxsize=1024)
+def _file_contributors(
+    work_tree: str, head: str, file_path: str
+) -> tuple[FileContributor, ...]:
+    """Compute get_file_contributors for file_path as of the head commit.
+
+    Keyed by commit rather than "HEAD", so entries go stale instead of wrong
+    when a new commit lands. Failed walks raise and are not cached.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with an error
+    """
+    contributors: dict[str, FileContributor] = {}
+
+    for email, name, date, added, removed in _log_line_counts(
+        work_tree, head, "--", file_path
+    ):
+        key = email
+        if key not in contributors:
+            contributors[key] = FileContributor(
+                name=name,
+                email=email,
+                commits=0,
+            )
+
+        committed = datetime.fromisoformat(date)
+        contributors[key].commits += 1
+        contributors[key].lines_added += added
+        contributors[key].lines_removed += removed
+        if (
+            contributors[key].last_commit_date is None
+            or committed > contributors[key].last_commit_date
+        ):
+            contributors[key].last_commit_date = committed
+
+    return tuple(sorted(contributors.values(), key=lambda c: c.commits, reverse=True))
+
+
+def _log_line_counts(cwd: str, *args: str) -> Iterator[tuple[str, str, str, int, int]]:
+    """Walk history with a single `git log --numstat` call.
+
+    Line counts are what each commit added and removed relative to its
+    parent; merge commits count none. Binary files count as 0 lines.
+
+    Args:
+        cwd: Work tree root to run git in
+        *args: `git log` revisions and options (limits, pathspec)
+
+    Yields:
+        Tuples of (author_email, author_name, committer_date_iso,
+        lines_added, lines_removed)
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with an error
+    """
+    raw = _run_git(
+        cwd,
+        "log", "--numstat", "--no-renames", "-z",
+        f"--format={_LOG_RECORD}%ae%x00%an%x00%cI",
+        *args,
+    )
+
+    for record in raw.decode("utf-8", errors="replace").split(_LOG_RECORD)[1:]:
+        fields = record.split("\0")
+        if len(fields) < 3:
+            continue
+        added = removed = 0
+        # "<added>\t<removed>\t<path>" entries follow the header after a newline
+        for entry in fields[3:]:
+            counts = entry.lstrip("\n").split("\t", 2)
+            if len(counts) == 3:
+                added += _count(counts[0])
+                removed += _count(counts[1])
+        yield fields[0], fields[1], fields[2], added, removed
+
+
+@functools.lru_cache(maxsize=8)
+def _open_repo(path: str) -> Repo:
+    """Open the repository containing an absolute path, once per path."""
+    return Repo(path, search_parent_directories=True)
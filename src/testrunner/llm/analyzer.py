@@ -4,26 +4,29 @@ This module provides failure analysis capabilities using an LLM to identify
 root causes and suggest fixes for failing tests.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
 
 from testrunner.llm.base import LLMClient
 from testrunner.storage.models import TestResult
 
 
-@dataclass
+@dataclass(slots=True)
 class FailureAnalysis:
     """Analysis of a test failure."""
 
     test_name: str
     likely_cause: str
-    suspected_file: Optional[str] = None
-    suspected_commit: Optional[str] = None
+    suspected_file: str | None = None
+    suspected_commit: str | None = None
     confidence: float = 0.0
     explanation: str = ""
     suggested_fix: str = ""
+    # JSON the LLM returned for this failure, kept for verbose output
+    raw_response: dict[str, Any] | None = field(default=None, repr=False, compare=False)
 
-    def to_dict(self) -> dict:
+    def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary format."""
         return {
             "test_name": self.test_name,
@@ -54,20 +57,81 @@ Be specific and actionable in your analysis. Focus on:
 
 Return ONLY valid JSON matching the schema provided."""
 
-    def __init__(self, llm_client: LLMClient):
+    # Task and schema footers, identical for every prompt
+    _ANALYSIS_TASK = "\n".join([
+        "## Task",
+        "",
+        "Identify the most likely cause of this test failure. Consider:",
+        "1. The error message and stack trace",
+        "2. Recently changed files that might be related",
+        "3. Recent commits that might have introduced the issue",
+        "",
+        "Provide a specific, actionable analysis.",
+        "",
+        "Respond with valid JSON matching this exact schema:",
+        "```json",
+        "{",
+        '  "likely_cause": "Brief description of what likely caused the failure",',
+        '  "suspected_file": "path/to/file.py or null if unknown",',
+        '  "suspected_commit": "commit_hash or null if unknown",',
+        '  "confidence": 0.75,',
+        '  "explanation": "Detailed explanation of why you think this is the cause",',
+        '  "suggested_fix": "Specific steps or code changes to fix the issue"',
+        "}",
+        "```",
+        "",
+        "Important: Return ONLY the JSON, no additional text.",
+    ])
+
+    _BATCH_TASK = "\n".join([
+        "## Task",
+        "",
+        "For EACH failing test, identify the most likely cause. Consider:",
+        "1. The error message and stack trace",
+        "2. Recently changed files that might be related",
+        "3. Recent commits that might have introduced the issue",
+        "",
+        "Provide a specific, actionable analysis per test.",
+        "",
+        "Respond with valid JSON matching this exact schema, with one entry per "
+        "failing test in the same order:",
+        "```json",
+        "{",
+        '  "analyses": [',
+        "    {",
+        '      "test_name": "exact test name from above",',
+        '      "likely_cause": "Brief description of what likely caused the failure",',
+        '      "suspected_file": "path/to/file.py or null if unknown",',
+        '      "suspected_commit": "commit_hash or null if unknown",',
+        '      "confidence": 0.75,',
+        '      "explanation": "Detailed explanation of why you think this is the cause",',
+        '      "suggested_fix": "Specific steps or code changes to fix the issue"',
+        "    }",
+        "  ]",
+        "}",
+        "```",
+        "",
+        "Important: Return ONLY the JSON, no additional text.",
+    ])
+
+    def __init__(self, llm_client: LLMClient, max_concurrency: int = 4):
         """Initialize analyzer with LLM client.
 
         Args:
             llm_client: LLM client for analysis
+            max_concurrency: Maximum number of in-flight LLM requests in analyze_multiple
         """
         self.client = llm_client
+        self.max_concurrency = max(1, max_concurrency)
+        # (git_changes, hints, section) for the last context section built
+        self._context_cache: tuple[dict | None, str | None, str] | None = None
 
     def analyze(
         self,
         test_result: TestResult,
-        git_changes: Optional[dict] = None,
-        hints: Optional[str] = None,
-    ) -> Optional[FailureAnalysis]:
+        git_changes: dict[str, Any] | None = None,
+        hints: str | None = None,
+    ) -> FailureAnalysis | None:
         """Analyze a test failure to identify root cause.
 
         Args:
@@ -105,8 +169,8 @@ Return ONLY valid JSON matching the schema provided."""
     def analyze_multiple(
         self,
         test_results: list[TestResult],
-        git_changes: Optional[dict] = None,
-        hints: Optional[str] = None,
+        git_changes: dict[str, Any] | None = None,
+        hints: str | None = None,
     ) -> list[FailureAnalysis]:
         """Analyze multiple test failures.
 
@@ -115,23 +179,141 @@ Return ONLY valid JSON matching the schema provided."""
             git_changes: Optional git changes context
             hints: Optional project context from HINTS.md
 
+        Failures are analyzed concurrently (up to max_concurrency at a time),
+        so total time approaches the slowest single analysis rather than the sum.
+        When called from inside a running event loop they are analyzed
+        sequentially instead.
+
+        Returns:
+            List of FailureAnalysis objects in input order (may be empty if errors occur)
+        """
+        if not test_results:
+            return []
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            analyses = asyncio.run(self._analyze_concurrently(test_results, git_changes, hints))
+        else:
+            # asyncio.run can't be nested in a running loop; analyze one at a time
+            analyses = [self.analyze(t, git_changes, hints) for t in test_results]
+        return [analysis for analysis in analyses if analysis]
+
+    def analyze_batch(
+        self,
+        test_results: list[TestResult],
+        git_changes: dict[str, Any] | None = None,
+        hints: str | None = None,
+    ) -> list[FailureAnalysis]:
+        """Analyze multiple test failures with a single LLM request.
+
+        The shared context (hints, git changes) is sent once instead of once per
+        failure. Failures the LLM response does not cover are analyzed
+        individually via analyze_multiple.
+
+        Args:
+            test_results: List of failed test results
+            git_changes: Optional git changes context
+            hints: Optional project context from HINTS.md
+
+        Returns:
+            List of FailureAnalysis objects in input order (may be empty if errors occur)
+        """
+        test_results = [t for t in test_results if t.error_message]
+        if len(test_results) < 2:
+            return self.analyze_multiple(test_results, git_changes, hints)
+
+        if not self.client.is_available():
+            return []
+
+        prompt = self._build_batch_prompt(test_results, git_changes, hints)
+
+        try:
+            response = self.client.generate_json(
+                prompt=prompt,
+                system_prompt=self.ANALYZER_SYSTEM_PROMPT,
+                temperature=0.3,
+            )
+        except Exception:
+            response = None
+
+        entries = response.get("analyses") if isinstance(response, dict) else None
+        if not isinstance(entries, list):
+            return self.analyze_multiple(test_results, git_changes, hints)
+
+        # Match entries by test name, falling back to position
+        by_name = {
+            entry.get("test_name"): entry for entry in entries if isinstance(entry, dict)
+        }
+        matched: list[FailureAnalysis | None] = []
+        for i, test_result in enumerate(test_results):
+            entry = by_name.get(test_result.test_name)
+            if entry is None and i < len(entries) and isinstance(entries[i], dict):
+                entry = entries[i]
+            try:
+                matched.append(
+                    self._convert_response_to_analysis(test_result.test_name, entry)
+                    if entry is not None
+                    else None
+                )
+            except (TypeError, ValueError):
+                matched.append(None)
+
+        missing = [t for t, a in zip(test_results, matched) if a is None]
+        if missing:
+            retried = {
+                a.test_name: a for a in self.analyze_multiple(missing, git_changes, hints)
+            }
+            matched = [
+                a if a is not None else retried.get(t.test_name)
+                for t, a in zip(test_results, matched)
+            ]
+
+        return [analysis for analysis in matched if analysis]
+
+    async def analyze_one(
+        self,
+        test_result: TestResult,
+        git_changes: dict[str, Any] | None = None,
+        hints: str | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> FailureAnalysis | None:
+        """Analyze a single failure without blocking the event loop.
+
+        The LLM clients are synchronous, so the request runs in a worker thread.
+
+        Args:
+            test_result: The failed test result
+            git_changes: Optional git changes context
+            hints: Optional project context from HINTS.md
+            semaphore: Optional semaphore bounding concurrent requests
+
         Returns:
-            List of FailureAnalysis objects (may be empty if errors occur)
+            FailureAnalysis if successful, None otherwise
         """
-        analyses = []
+        if semaphore is None:
+            return await asyncio.to_thread(self.analyze, test_result, git_changes, hints)
 
-        for test_result in test_results:
-            analysis = self.analyze(test_result, git_changes, hints)
-            if analysis:
-                analyses.append(analysis)
+        async with semaphore:
+            return await asyncio.to_thread(self.analyze, test_result, git_changes, hints)
 
-        return analyses
+    async def _analyze_concurrently(
+        self,
+        test_results: list[TestResult],
+        git_changes: dict[str, Any] | None,
+        hints: str | None,
+    ) -> list[FailureAnalysis | None]:
+        """Run analyze_one for every failure, capped at max_concurrency in flight."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(
+            *(self.analyze_one(t, git_changes, hints, semaphore) for t in test_results)
+        )
 
     def _build_analysis_prompt(
         self,
         test_result: TestResult,
-        git_changes: Optional[dict],
-        hints: Optional[str] = None,
+        git_changes: dict[str, Any] | None,
+        hints: str | None = None,
     ) -> str:
         """Build analysis prompt for LLM.
 
@@ -157,6 +339,44 @@ Return ONLY valid JSON matching the schema provided."""
             "",
         ]
 
+        context = self._context_section(git_changes, hints)
+        if context:
+            prompt_parts.append(context)
+        prompt_parts.append(self._ANALYSIS_TASK)
+
+        return "\n".join(prompt_parts)
+
+    def _context_section(self, git_changes: dict[str, Any] | None, hints: str | None) -> str:
+        """Return the joined context section, reusing it for the same inputs.
+
+        analyze_multiple passes the same git_changes and hints objects for
+        every failure, so the section is built once per batch rather than
+        once per prompt. The inputs are expected not to change in between.
+        """
+        cached = self._context_cache
+        if cached is not None and cached[0] is git_changes and cached[1] is hints:
+            return cached[2]
+
+        section = "\n".join(self._build_context_parts(git_changes, hints))
+        self._context_cache = (git_changes, hints, section)
+        return section
+
+    def _build_context_parts(
+        self,
+        git_changes: dict[str, Any] | None,
+        hints: str | None = None,
+    ) -> list[str]:
+        """Build the project hints and git context sections shared by all prompts.
+
+        Args:
+            git_changes: Git changes context
+            hints: Optional project context from HINTS.md
+
+        Returns:
+            List of prompt lines
+        """
+        prompt_parts: list[str] = []
+
         # Add project hints if available
         if hints:
             prompt_parts.extend([
@@ -174,55 +394,75 @@ Return ONLY valid JSON matching the schema provided."""
                 prompt_parts.extend([
                     "## Recently Changed Files",
                     "",
+                    "\n".join(
+                        f"- {f.get('path', 'unknown')} ({f.get('change_type', '?')})"
+                        for f in changed_files[:15]  # Limit to 15 files
+                    ),
+                    "",
                 ])
-                for file_info in changed_files[:15]:  # Limit to 15 files
-                    path = file_info.get("path", "unknown")
-                    change_type = file_info.get("change_type", "?")
-                    prompt_parts.append(f"- {path} ({change_type})")
-                prompt_parts.append("")
 
             if recent_commits:
                 prompt_parts.extend([
                     "## Recent Commits",
                     "",
+                    "\n".join(
+                        f"- [{c.get('short_hash', '?')}] {c.get('message', '')[:80]}"
+                        for c in recent_commits[:10]  # Limit to 10 commits
+                    ),
+                    "",
                 ])
-                for commit in recent_commits[:10]:  # Limit to 10 commits
-                    short_hash = commit.get("short_hash", "?")
-                    message = commit.get("message", "")[:80]
-                    prompt_parts.append(f"- [{short_hash}] {message}")
-                prompt_parts.append("")
-
-        prompt_parts.extend([
-            "## Task",
-            "",
-            "Identify the most likely cause of this test failure. Consider:",
-            "1. The error message and stack trace",
-            "2. Recently changed files that might be related",
-            "3. Recent commits that might have introduced the issue",
-            "",
-            "Provide a specific, actionable analysis.",
-            "",
-            "Respond with valid JSON matching this exact schema:",
-            "```json",
-            "{",
-            '  "likely_cause": "Brief description of what likely caused the failure",',
-            '  "suspected_file": "path/to/file.py or null if unknown",',
-            '  "suspected_commit": "commit_hash or null if unknown",',
-            '  "confidence": 0.75,',
-            '  "explanation": "Detailed explanation of why you think this is the cause",',
-            '  "suggested_fix": "Specific steps or code changes to fix the issue"',
-            "}",
-            "```",
+
+        return prompt_parts
+
+    def _build_batch_prompt(
+        self,
+        test_results: list[TestResult],
+        git_changes: dict[str, Any] | None,
+        hints: str | None = None,
+    ) -> str:
+        """Build a single prompt covering several failures.
+
+        The hints and git context are included once for all failures.
+
+        Args:
+            test_results: Failed test results
+            git_changes: Git changes context
+            hints: Optional project context from HINTS.md
+
+        Returns:
+            Formatted prompt string
+        """
+        prompt_parts = [
+            f"Analyze the following {len(test_results)} test failures and identify "
+            "the root cause of each.",
             "",
-            "Important: Return ONLY the JSON, no additional text.",
-        ])
+        ]
+
+        context = self._context_section(git_changes, hints)
+        if context:
+            prompt_parts.append(context)
+
+        for i, test_result in enumerate(test_results, 1):
+            prompt_parts.extend([
+                f"## Failing Test {i}",
+                f"Test: {test_result.test_name}",
+                f"File: {test_result.test_file or 'unknown'}",
+                "",
+                "### Error Message",
+                "```",
+                test_result.error_message[:5000],  # Limit error message length
+                "```",
+                "",
+            ])
+
+        prompt_parts.append(self._BATCH_TASK)
 
         return "\n".join(prompt_parts)
 
     def _convert_response_to_analysis(
         self,
         test_name: str,
-        response: dict,
+        response: dict[str, Any],
     ) -> FailureAnalysis:
         """Convert LLM JSON response to FailureAnalysis.
 
@@ -241,4 +481,5 @@ Return ONLY valid JSON matching the schema provided."""
             confidence=float(response.get("confidence", 0.5)),
             explanation=response.get("explanation", ""),
             suggested_fix=response.get("suggested_fix", ""),
+            raw_response=response,
         )
@@ -1,8 +1,15 @@
 """Base LLM client interface."""
 
+import json
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of JSON responses
+    orjson = None  # type: ignore[assignment]
 
 
 @dataclass
@@ -11,8 +18,8 @@ class LLMResponse:
 
     content: str
     model: str
-    usage: Optional[dict[str, int]] = None
-    raw_response: Optional[dict] = None
+    usage: dict[str, int] | None = None
+    raw_response: dict | None = None
 
     @property
     def success(self) -> bool:
@@ -22,17 +29,22 @@ class LLMResponse:
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
 
+    # Seconds an is_available() result is reused before probing again
+    AVAILABILITY_TTL = 5.0
+
     def __init__(self):
         self.last_raw_content: str = ""
         self.response_log: list[str] = []
+        self._available = False
+        self._available_until = 0.0
 
     @abstractmethod
     def generate(
         self,
         prompt: str,
-        system_prompt: Optional[str] = None,
+        system_prompt: str | None = None,
         temperature: float = 0.7,
-        max_tokens: Optional[int] = None,
+        max_tokens: int | None = None,
     ) -> LLMResponse:
         """Generate a response from the LLM.
 
@@ -47,17 +59,29 @@ class LLMClient(ABC):
         """
         pass
 
-    @abstractmethod
     def is_available(self) -> bool:
-        """Check if the LLM service is available."""
+        """Check if the LLM service is available.
+
+        The last probe's result is reused for AVAILABILITY_TTL seconds, so
+        analyses issued back to back don't each pay a health-check round trip.
+        """
+        now = time.monotonic()
+        if now >= self._available_until:
+            self._available = self._check_available()
+            self._available_until = now + self.AVAILABILITY_TTL
+        return self._available
+
+    @abstractmethod
+    def _check_available(self) -> bool:
+        """Probe the LLM service for availability (uncached)."""
         pass
 
     def generate_json(
         self,
         prompt: str,
-        system_prompt: Optional[str] = None,
+        system_prompt: str | None = None,
         temperature: float = 0.3,
-    ) -> Optional[dict[str, Any]]:
+    ) -> dict[str, Any] | None:
         """Generate a JSON response from the LLM.
 
         Args:
@@ -68,12 +92,10 @@ class LLMClient(ABC):
         Returns:
             Parsed JSON dict or None if parsing fails
         """
-        import json
-
         # Add JSON instruction to the prompt
         json_prompt = f"{prompt}\n\nRespond with valid JSON only, no additional text."
 
-        response = self.generate(
+        response = self._generate_for_json(
             prompt=json_prompt,
             system_prompt=system_prompt,
             temperature=temperature,
@@ -91,20 +113,86 @@ class LLMClient(ABC):
 
         # Handle markdown code blocks
         if content.startswith("```"):
-            lines = content.split("\n")
-            # Remove first and last lines (```json and ```)
-            content = "\n".join(lines[1:-1] if lines[-1] == "```" else lines[1:])
+            # Remove first and last lines (```json and ```) without splitting every line
+            content = content.partition("\n")[2]
+            head, _, last = content.rpartition("\n")
+            if last == "```":
+                content = head
 
         try:
-            return json.loads(content)
+            return _loads(content)
         except json.JSONDecodeError:
-            # Try to find JSON in the response
-            import re
-
-            json_match = re.search(r"\{[\s\S]*\}", content)
-            if json_match:
-                try:
-                    return json.loads(json_match.group())
-                except json.JSONDecodeError:
-                    pass
+            # Try to find JSON in the response: the first balanced object,
+            # then everything from the first "{" to the last "}"
+            start = content.find("{")
+            if start == -1:
+                return None
+            for candidate in (
+                _balanced_object(content, start),
+                content[start : content.rfind("}") + 1],
+            ):
+                if candidate:
+                    try:
+                        return _loads(candidate)
+                    except json.JSONDecodeError:
+                        pass
             return None
+
+    def _generate_for_json(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float = 0.3,
+    ) -> LLMResponse:
+        """Generate the raw response for generate_json.
+
+        Providers with a native JSON output mode override this to enable it.
+        """
+        return self.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+        )
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON with orjson if installed, else (or if it refuses) the stdlib.
+
+    The stdlib also accepts NaN/Infinity and integers wider than 64 bits.
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _balanced_object(content: str, start: int) -> str | None:
+    """Return the {...} span opening at content[start], or None if unclosed.
+
+    A single left-to-right scan that counts braces outside JSON strings.
+    """
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(content)):
+        char = content[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return content[start : i + 1]
+    return None
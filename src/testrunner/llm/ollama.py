@@ -1,7 +1,7 @@
 """Ollama LLM client implementation."""
 
 import os
-from typing import Optional
+from typing import Any
 
 import httpx
 
@@ -16,6 +16,7 @@ class OllamaClient(LLMClient):
         base_url: str = "http://localhost:11434",
         model: str = "llama3.2",
         timeout: int = 120,
+        keep_alive: int | str | None = None,
     ):
         """Initialize Ollama client.
 
@@ -23,19 +24,45 @@ class OllamaClient(LLMClient):
             base_url: Ollama API base URL
             model: Model name to use
             timeout: Request timeout in seconds
+            keep_alive: How long Ollama keeps the model loaded after each request
+                (e.g. "10m", or -1 to keep it resident); server default if None
         """
         super().__init__()
         # Allow environment variable override
         self.base_url = os.environ.get("OLLAMA_HOST", base_url).rstrip("/")
         self.model = model
         self.timeout = timeout
+        self.keep_alive = keep_alive
+        self._http: httpx.Client | None = None
+
+    @property
+    def http(self) -> httpx.Client:
+        """Get the pooled HTTP client, creating it on first use.
+
+        A single client keeps connections alive across calls, so repeated
+        requests to the same Ollama host skip the TCP handshake.
+        """
+        if self._http is None:
+            self._http = httpx.Client(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=8),
+                transport=httpx.HTTPTransport(retries=3),
+            )
+        return self._http
+
+    def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     def generate(
         self,
         prompt: str,
-        system_prompt: Optional[str] = None,
+        system_prompt: str | None = None,
         temperature: float = 0.7,
-        max_tokens: Optional[int] = None,
+        max_tokens: int | None = None,
+        format: str | None = None,
     ) -> LLMResponse:
         """Generate a response from Ollama.
 
@@ -44,6 +71,7 @@ class OllamaClient(LLMClient):
             system_prompt: Optional system prompt for context
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate (num_predict in Ollama)
+            format: Output format constraint (e.g. "json" for Ollama's JSON mode)
 
         Returns:
             LLMResponse with the generated content
@@ -65,23 +93,28 @@ class OllamaClient(LLMClient):
         if max_tokens:
             payload["options"]["num_predict"] = max_tokens
 
+        if format:
+            payload["format"] = format
+
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(url, json=payload)
-                response.raise_for_status()
-
-                data = response.json()
-
-                return LLMResponse(
-                    content=data.get("response", ""),
-                    model=data.get("model", self.model),
-                    usage={
-                        "prompt_tokens": data.get("prompt_eval_count", 0),
-                        "completion_tokens": data.get("eval_count", 0),
-                        "total_duration_ns": data.get("total_duration", 0),
-                    },
-                    raw_response=data,
-                )
+            response = self.http.post(url, json=payload)
+            response.raise_for_status()
+
+            data = response.json()
+
+            return LLMResponse(
+                content=data.get("response", ""),
+                model=data.get("model", self.model),
+                usage={
+                    "prompt_tokens": data.get("prompt_eval_count", 0),
+                    "completion_tokens": data.get("eval_count", 0),
+                    "total_duration_ns": data.get("total_duration", 0),
+                },
+                raw_response=data,
+            )
 
         except httpx.TimeoutException:
             return LLMResponse(
@@ -102,27 +135,57 @@ class OllamaClient(LLMClient):
                 raw_response={"error": str(e)},
             )
 
-    def is_available(self) -> bool:
+    def _generate_for_json(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float = 0.3,
+    ) -> LLMResponse:
+        """Generate with Ollama's JSON mode so the response is always parseable."""
+        return self.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            format="json",
+        )
+
+    def warm_up(self) -> bool:
+        """Load the model into memory ahead of the first real request.
+
+        An empty prompt makes Ollama load the model without generating anything.
+
+        Returns:
+            True if the model was loaded
+        """
+        payload: dict[str, Any] = {"model": self.model, "prompt": "", "stream": False}
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+
+        try:
+            response = self.http.post(f"{self.base_url}/api/generate", json=payload)
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    def _check_available(self) -> bool:
         """Check if Ollama service is available."""
         try:
-            with httpx.Client(timeout=5) as client:
-                response = client.get(f"{self.base_url}/api/tags")
-                return response.status_code == 200
+            response = self.http.get(f"{self.base_url}/api/tags", timeout=5)
+            return response.status_code == 200
         except Exception:
             return False
 
     def list_models(self) -> list[str]:
         """List available models on the Ollama instance."""
         try:
-            with httpx.Client(timeout=10) as client:
-                response = client.get(f"{self.base_url}/api/tags")
-                response.raise_for_status()
-                data = response.json()
-                return [model["name"] for model in data.get("models", [])]
+            response = self.http.get(f"{self.base_url}/api/tags", timeout=10)
+            response.raise_for_status()
+            data = response.json()
+            return [model["name"] for model in data.get("models", [])]
         except Exception:
             return []
 
-    def pull_model(self, model_name: Optional[str] = None) -> bool:
+    def pull_model(self, model_name: str | None = None) -> bool:
         """Pull a model from Ollama registry.
 
         Args:
@@ -134,12 +197,12 @@ class OllamaClient(LLMClient):
         model = model_name or self.model
 
         try:
-            with httpx.Client(timeout=600) as client:  # Long timeout for download
-                response = client.post(
-                    f"{self.base_url}/api/pull",
-                    json={"name": model, "stream": False},
-                )
-                return response.status_code == 200
+            response = self.http.post(
+                f"{self.base_url}/api/pull",
+                json={"name": model, "stream": False},
+                timeout=600,  # Long timeout for download
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -168,23 +231,25 @@ class OllamaClient(LLMClient):
             },
         }
 
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(url, json=payload)
-                response.raise_for_status()
-
-                data = response.json()
-                message = data.get("message", {})
-
-                return LLMResponse(
-                    content=message.get("content", ""),
-                    model=data.get("model", self.model),
-                    usage={
-                        "prompt_tokens": data.get("prompt_eval_count", 0),
-                        "completion_tokens": data.get("eval_count", 0),
-                    },
-                    raw_response=data,
-                )
+            response = self.http.post(url, json=payload)
+            response.raise_for_status()
+
+            data = response.json()
+            message = data.get("message", {})
+
+            return LLMResponse(
+                content=message.get("content", ""),
+                model=data.get("model", self.model),
+                usage={
+                    "prompt_tokens": data.get("prompt_eval_count", 0),
+                    "completion_tokens": data.get("eval_count", 0),
+                },
+                raw_response=data,
+            )
 
         except Exception as e:
             return LLMResponse(
@@ -108,7 +108,7 @@ class OpenRouterClient(LLMClient):
                 raw_response={"error": str(e)},
             )
 
-    def is_available(self) -> bool:
+    def _check_available(self) -> bool:
         """Check if OpenRouter API is reachable."""
         try:
             with httpx.Client(timeout=5) as client:
@@ -4,14 +4,65 @@ This module provides a language-agnostic test output parser that uses an LLM
 to understand and parse test results from any testing framework.
 """
 
+import re
+from collections import Counter
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
-from typing import Literal, Optional
+from pathlib import Path
 
 from testrunner.llm.base import LLMClient
 from testrunner.storage.models import TestResult, TestStatus
 
-
-@dataclass
+# Status names the LLM is asked to report, mapped once rather than per test
+_STATUS_BY_NAME = {
+    "passed": TestStatus.PASSED,
+    "failed": TestStatus.FAILED,
+    "skipped": TestStatus.SKIPPED,
+    "error": TestStatus.ERROR,
+}
+
+# Status keywords recognised by the fallback parser, counted in a single scan.
+# The lookahead lets the regex engine skip positions that can't start a keyword.
+_STATUS_KEYWORDS = re.compile(
+    r"(?=[PpOoFfEeSs✓✗○])\b(?:"
+    r"(?P<passed>PASS|PASSED|OK|✓)"
+    r"|(?P<failed>FAIL|FAILED|ERROR|✗)"
+    r"|(?P<skipped>SKIP|SKIPPED|○)"
+    r")\b",
+    re.IGNORECASE,
+)
+
+# Substrings a casefolded line must contain for _STATUS_KEYWORDS to match it.
+# "fa" and "sk" rather than "fail" and "skip": under IGNORECASE "i" also
+# matches dotless "ı", which casefold() leaves alone.
+_STATUS_HINTS = ("pass", "ok", "fa", "error", "sk", "✓", "✗", "○")
+
+# Characters of raw output kept on ParsedTestOutput; the end of a run
+# (summary, last failures) is the useful part, so the tail is kept.
+_MAX_RAW_OUTPUT = 65536
+
+
+def _count_statuses(lines: Iterable[str], counts: Counter[str | None]) -> None:
+    """Add the status keywords found in lines to counts.
+
+    Most lines of a log (tracebacks, captured output) can't match, so only
+    lines that contain a keyword substring are handed to the regex.
+    """
+    hints = _STATUS_HINTS
+    for line in lines:
+        folded = line.casefold()
+        for hint in hints:
+            if hint in folded:
+                counts.update(m.lastgroup for m in _STATUS_KEYWORDS.finditer(line))
+                break
+
+
+def _tail(text: str) -> str:
+    """Return at most the last _MAX_RAW_OUTPUT characters of text."""
+    return text if len(text) <= _MAX_RAW_OUTPUT else text[-_MAX_RAW_OUTPUT:]
+
+
+@dataclass(slots=True)
 class ParsedTestOutput:
     """Structured test output parsed from raw command output."""
 
@@ -74,9 +125,10 @@ Return ONLY valid JSON matching the exact schema provided."""
         stdout: str,
         stderr: str,
         exit_code: int,
-        test_command: Optional[str] = None,
-        language: Optional[str] = None,
-        hints: Optional[str] = None,
+        test_command: str | None = None,
+        language: str | None = None,
+        hints: str | None = None,
+        log_paths: Sequence[Path] = (),
     ) -> ParsedTestOutput:
         """Parse raw test output into structured results.
 
@@ -87,12 +139,18 @@ Return ONLY valid JSON matching the exact schema provided."""
             test_command: The command that was run (helps LLM understand framework)
             language: Optional language hint (e.g., "python", "javascript")
             hints: Optional project context from HINTS.md
+            log_paths: Full stdout/stderr log files, when stdout and stderr only
+                hold their tails; the fallback parser counts over these
 
         Returns:
             ParsedTestOutput with structured test results
         """
+        # Nothing for the LLM to read; skip the availability check and request
+        if not stdout.strip() and not stderr.strip():
+            return self._fallback_parse(stdout, stderr, exit_code, log_paths)
+
         if not self.client.is_available():
-            return self._fallback_parse(stdout, stderr, exit_code)
+            return self._fallback_parse(stdout, stderr, exit_code, log_paths)
 
         # Build parsing prompt
         prompt = self._build_parse_prompt(
@@ -115,20 +173,20 @@ Return ONLY valid JSON matching the exact schema provided."""
             if response:
                 return self._convert_response_to_output(response, stdout)
             else:
-                return self._fallback_parse(stdout, stderr, exit_code)
+                return self._fallback_parse(stdout, stderr, exit_code, log_paths)
 
-        except Exception as e:
+        except Exception:
             # If LLM fails, use simple fallback
-            return self._fallback_parse(stdout, stderr, exit_code)
+            return self._fallback_parse(stdout, stderr, exit_code, log_paths)
 
     def _build_parse_prompt(
         self,
         stdout: str,
         stderr: str,
         exit_code: int,
-        test_command: Optional[str],
-        language: Optional[str],
-        hints: Optional[str] = None,
+        test_command: str | None,
+        language: str | None,
+        hints: str | None = None,
     ) -> str:
         """Build the parsing prompt for the LLM.
 
@@ -143,15 +201,17 @@ Return ONLY valid JSON matching the exact schema provided."""
         Returns:
             Formatted prompt string
         """
-        # Truncate output if too long (to avoid token limits)
+        # Truncate output if too long (to avoid token limits). Keep the end:
+        # the executor already hands over the tail of each stream, and that is
+        # where test runners print failures and the summary.
         max_output_length = 15000
-        stdout_truncated = stdout[:max_output_length]
-        stderr_truncated = stderr[:max_output_length]
+        stdout_truncated = stdout[-max_output_length:]
+        stderr_truncated = stderr[-max_output_length:]
 
         if len(stdout) > max_output_length:
-            stdout_truncated += "\n... (output truncated)"
+            stdout_truncated = "... (output truncated)\n" + stdout_truncated
         if len(stderr) > max_output_length:
-            stderr_truncated += "\n... (output truncated)"
+            stderr_truncated = "... (output truncated)\n" + stderr_truncated
 
         prompt_parts = [
             "Parse the following test output and extract structured results.",
@@ -249,16 +309,11 @@ Return ONLY valid JSON matching the exact schema provided."""
         """
         tests = []
 
+        status_map = _STATUS_BY_NAME
+        error = TestStatus.ERROR
         for test_data in response.get("tests", []):
             # Parse status
-            status_str = test_data.get("status", "error").lower()
-            status_map = {
-                "passed": TestStatus.PASSED,
-                "failed": TestStatus.FAILED,
-                "skipped": TestStatus.SKIPPED,
-                "error": TestStatus.ERROR,
-            }
-            status = status_map.get(status_str, TestStatus.ERROR)
+            status = status_map.get(test_data.get("status", "error").lower(), error)
 
             test = TestResult(
                 test_name=test_data.get("name", "unknown"),
@@ -279,7 +334,7 @@ Return ONLY valid JSON matching the exact schema provided."""
             failed=summary.get("failed", 0),
             skipped=summary.get("skipped", 0),
             duration_ms=summary.get("duration_ms", 0),
-            raw_output=raw_output,
+            raw_output=_tail(raw_output),
             parse_confidence=1.0,  # Assume high confidence from LLM
         )
 
@@ -288,6 +343,7 @@ Return ONLY valid JSON matching the exact schema provided."""
         stdout: str,
         stderr: str,
         exit_code: int,
+        log_paths: Sequence[Path] = (),
     ) -> ParsedTestOutput:
         """Simple fallback parser when LLM is unavailable.
 
@@ -298,18 +354,28 @@ Return ONLY valid JSON matching the exact schema provided."""
             stdout: Standard output
             stderr: Standard error
             exit_code: Exit code
+            log_paths: Full log files to count over instead of stdout/stderr
 
         Returns:
             ParsedTestOutput with basic parsing
         """
-        import re
-
-        combined = stdout + "\n" + stderr
-
-        # Try to count passes/failures with common patterns
-        passed = len(re.findall(r'\b(PASS|PASSED|OK|✓)\b', combined, re.IGNORECASE))
-        failed = len(re.findall(r'\b(FAIL|FAILED|ERROR|FAILED|✗)\b', combined, re.IGNORECASE))
-        skipped = len(re.findall(r'\b(SKIP|SKIPPED|○)\b', combined, re.IGNORECASE))
+        # Try to count passes/failures with common patterns, over the complete
+        # logs when available; the in-memory streams may be truncated.
+        # The streams are scanned separately; they are only joined for raw_output.
+        counts: Counter[str | None] = Counter()
+        try:
+            for path in log_paths:
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    _count_statuses(f, counts)
+        except OSError:
+            counts.clear()
+            log_paths = ()
+        if not log_paths:
+            for stream in (stdout, stderr):
+                _count_statuses(stream.splitlines(), counts)
+        passed = counts["passed"]
+        failed = counts["failed"]
+        skipped = counts["skipped"]
 
         # If exit code is non-zero but we found no failures, mark at least one failure
         if exit_code != 0 and failed == 0:
@@ -324,6 +390,6 @@ Return ONLY valid JSON matching the exact schema provided."""
             failed=failed,
             skipped=skipped,
             duration_ms=0,
-            raw_output=combined,
+            raw_output=_tail(stdout + "\n" + stderr),
             parse_confidence=0.3,  # Low confidence for fallback
         )
@@ -1,6 +1,5 @@
 """Report generation using Jinja2 templates."""
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -8,6 +7,7 @@ from typing import Any, Optional
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from testrunner.config import TestRunnerConfig
+from testrunner.core.fs import ensure_dir
 
 
 class ReportGenerator:
@@ -59,8 +59,7 @@ class ReportGenerator:
         html_content = template.render(**context)
 
         # Write report file
-        output_dir = self.base_dir / self.config.report.output_dir
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = ensure_dir(self.base_dir / self.config.report.output_dir)
 
         report_path = output_dir / self.config.report.filename
         report_path.write_text(html_content, encoding="utf-8")
@@ -94,9 +93,14 @@ class ReportGenerator:
 
         # Organize test results by status
         all_results = results.get("results", [])
-        failed_tests = [r for r in all_results if r.get("status") == "failed"]
-        passed_tests = [r for r in all_results if r.get("status") == "passed"]
-        skipped_tests = [r for r in all_results if r.get("status") == "skipped"]
+        failed_tests: list[dict[str, Any]] = []
+        passed_tests: list[dict[str, Any]] = []
+        skipped_tests: list[dict[str, Any]] = []
+        by_status = {"failed": failed_tests, "passed": passed_tests, "skipped": skipped_tests}
+        for r in all_results:
+            bucket = by_status.get(r.get("status"))
+            if bucket is not None:
+                bucket.append(r)
 
         # Sort by duration (slowest first) for performance insights
         for tests in [failed_tests, passed_tests, skipped_tests]:
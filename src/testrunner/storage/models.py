@@ -1,6 +1,6 @@
 """Data models for test results and history."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -59,7 +59,7 @@ class TestRun:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Represents the result of a single test."""
 
@@ -0,0 +1,71 @@
+"""Tests for the command-line interface."""
+
+import subprocess
+import sys
+
+from click.testing import CliRunner
+
+from testrunner import __version__
+from testrunner.cli import main
+
+
+def _modules_loaded_by(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestCLI:
+    """Tests for the CLI entry point."""
+
+    def test_version(self):
+        """Test that --version prints the package version."""
+        result = CliRunner().invoke(main, ["--version"])
+
+        assert result.exit_code == 0
+        assert __version__ in result.output
+
+    def test_help_lists_lazy_subcommands(self):
+        """Test that --help lists the lazily registered subcommands."""
+        result = CliRunner().invoke(main, ["--help"])
+
+        assert result.exit_code == 0
+        assert "init" in result.output
+        assert "run" in result.output
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        """Test that importing the CLI does not pull in config, pydantic, or rich."""
+        modules = _modules_loaded_by("import testrunner.cli")
+
+        assert "testrunner.config" not in modules
+        assert "pydantic" not in modules
+        assert "rich" not in modules
+        assert "testrunner.commands.run" not in modules
+
+    def test_help_does_not_import_subcommands(self):
+        """Test that top-level --help is rendered without importing any command module."""
+        modules = _modules_loaded_by(
+            "from click.testing import CliRunner\n"
+            "from testrunner.cli import main\n"
+            "CliRunner().invoke(main, ['--help'])"
+        )
+
+        assert "testrunner.commands.init" not in modules
+        assert "testrunner.commands.run" not in modules
+
+    def test_version_fast_path_skips_click(self):
+        """Test that a bare --version is answered without importing click."""
+        modules = _modules_loaded_by(
+            "import sys\n"
+            "sys.argv = ['testrunner', '--version']\n"
+            "from testrunner.__main__ import main\n"
+            "main()"
+        )
+
+        assert "click" not in modules
+        assert "testrunner.cli" not in modules
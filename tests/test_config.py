@@ -3,6 +3,7 @@
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -147,6 +148,66 @@ class TestTestRunnerConfig:
         with pytest.raises(FileNotFoundError):
             TestRunnerConfig.from_file("/nonexistent/path.json")
 
+    def test_from_file_cached(self):
+        """Test that cached loading reuses the parse until the file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "testrunner.json"
+            path.write_text(json.dumps({"project": {"name": "first"}}))
+
+            config = TestRunnerConfig.from_file_cached(path)
+            assert config.project.name == "first"
+            assert not (Path(tmpdir) / ".testrunner").exists()
+
+            # Mutating the returned copy must not leak into the cache
+            config.project.name = "mutated"
+            assert TestRunnerConfig.from_file_cached(path).project.name == "first"
+
+            path.write_text(json.dumps({"project": {"name": "second-name"}}))
+            assert TestRunnerConfig.from_file_cached(path).project.name == "second-name"
+
+    def test_from_file_cached_not_found(self):
+        """Test cached loading from non-existent file raises error."""
+        with pytest.raises(FileNotFoundError):
+            TestRunnerConfig.from_file_cached("/nonexistent/path.json")
+
+    def test_find_and_load_reuses_cached_parse(self):
+        """Test that repeated find_and_load calls don't re-read the file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            nested = Path(tmpdir) / "a" / "b"
+            nested.mkdir(parents=True)
+            (Path(tmpdir) / "testrunner.json").write_text(
+                json.dumps({"project": {"name": "found"}})
+            )
+
+            assert TestRunnerConfig.find_and_load(nested).project.name == "found"
+            with patch.object(TestRunnerConfig, "from_file") as from_file:
+                assert TestRunnerConfig.find_and_load(nested).project.name == "found"
+            from_file.assert_not_called()
+
+    def test_find_config_file_from_relative_dir(self, monkeypatch):
+        """Test that a relative start dir still searches its parents."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            nested = Path(tmpdir) / "pkg" / "tests"
+            nested.mkdir(parents=True)
+            (Path(tmpdir) / ".testrunner.json").write_text("{}")
+            monkeypatch.chdir(Path(tmpdir) / "pkg")
+
+            found = TestRunnerConfig.find_config_file("tests")
+
+            assert found.name == ".testrunner.json"
+            assert found.parent.resolve() == Path(tmpdir).resolve()
+
+    def test_find_config_file_skips_directories(self):
+        """Test that a directory named like a config file is not returned."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            nested = Path(tmpdir) / "pkg"
+            (nested / "testrunner.json").mkdir(parents=True)
+            (Path(tmpdir) / "testrunner.json").write_text("{}")
+
+            found = TestRunnerConfig.find_config_file(nested)
+
+            assert found == Path(tmpdir) / "testrunner.json"
+
     def test_to_file(self):
         """Test saving configuration to a file."""
         config = get_default_config()
@@ -161,6 +222,20 @@ class TestTestRunnerConfig:
             loaded = TestRunnerConfig.from_file(path)
             assert loaded.project.name == "saved-project"
 
+    def test_to_file_without_orjson(self):
+        """Test that saving and loading fall back to the json module."""
+        config = get_default_config()
+        config.project.name = "stdlib-project"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.json"
+            with patch("testrunner.config.orjson", None):
+                config.to_file(path)
+                loaded = TestRunnerConfig.from_file(path)
+
+            assert loaded.project.name == "stdlib-project"
+            assert json.loads(path.read_text()) == config.model_dump()
+
     def test_create_example_config(self):
         """Test creating an example configuration file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -187,7 +262,38 @@ class TestTestRunnerConfig:
             paths = config.get_absolute_paths(base_dir)
 
             assert paths["working_directory"].is_absolute()  # Changed key name
-            assert paths["working_directory"] == base_dir.resolve()  # Should be the tmpdir itself
+            assert paths["working_directory"] == base_dir  # Should be the tmpdir itself
+
+    def test_get_absolute_paths_canonical(self):
+        """Test that symlinks are only resolved when canonical paths are requested."""
+        config = get_default_config()
+        config.report.output_dir = "link/reports"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            (base_dir / "real").mkdir()
+            (base_dir / "link").symlink_to(base_dir / "real")
+
+            plain = config.get_absolute_paths(base_dir)
+            canonical = config.get_absolute_paths(base_dir, canonical=True)
+
+            assert plain["report_output_dir"] == base_dir / "link" / "reports"
+            assert canonical["report_output_dir"] == base_dir.resolve() / "real" / "reports"
+
+    def test_get_absolute_paths_tracks_config_changes(self):
+        """Test that cached path resolution follows config edits and returns copies."""
+        config = get_default_config()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            paths = config.get_absolute_paths(base_dir)
+            paths["report_output_dir"] = Path("/elsewhere")
+
+            config.report.output_dir = "out"
+            updated = config.get_absolute_paths(base_dir)
+
+            assert updated["report_output_dir"] == base_dir / "out"
+            assert config.get_absolute_paths(base_dir) == updated
 
     def test_get_hints_content(self):
         """Test reading hints file content."""
@@ -210,3 +316,17 @@ class TestTestRunnerConfig:
         with tempfile.TemporaryDirectory() as tmpdir:
             content = config.get_hints_content(tmpdir)
             assert content is None
+
+    def test_get_hints_content_is_cached(self):
+        """Test that the hints file is only read once per path."""
+        config = get_default_config()
+        config.hints_file = "HINTS.md"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            hints_path = base_dir / "HINTS.md"
+            hints_path.write_text("original")
+
+            assert config.get_hints_content(base_dir) == "original"
+            hints_path.write_text("changed")
+            assert config.get_hints_content(base_dir) == "original"
@@ -3,9 +3,8 @@
 import tempfile
 from pathlib import Path
 
-import pytest
 
-from testrunner.core.executor import ExecutionError, RawTestOutput, TestExecutor
+from testrunner.core.executor import RawTestOutput, TestExecutor
 
 
 class TestTestExecutor:
@@ -208,6 +207,56 @@ class TestTestExecutor:
         # But not unreasonably long
         assert result.duration_ms < 10000
 
+    def test_refresh_env_picks_up_changes(self):
+        """Test that environment changes apply after refresh_env."""
+        executor = TestExecutor(
+            command="echo $LATE_VAR",
+            working_directory=Path.cwd(),
+            timeout_seconds=10,
+        )
+
+        executor.environment = {"LATE_VAR": "late_value"}
+        executor.refresh_env()
+        result = executor.execute()
+
+        assert "late_value" in result.stdout
+
+    def test_simple_command_runs_without_shell(self):
+        """Test that commands without shell syntax are spawned directly."""
+        import os
+        import sys
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            script = Path(tmpdir) / "print_parent.py"
+            script.write_text("import os\nprint(os.getppid())\n")
+            executor = TestExecutor(
+                command=f"{sys.executable} print_parent.py",
+                working_directory=Path(tmpdir),
+                timeout_seconds=10,
+            )
+
+            result = executor.execute()
+
+        assert result.stdout.strip() == str(os.getpid())
+
+    def test_shell_syntax_still_uses_shell(self):
+        """Test that pipes, assignments and builtins keep working via the shell."""
+        for command, expected in [
+            ("echo piped | tr a-z A-Z", "PIPED"),
+            ("GREETING=hi env", "GREETING=hi"),
+            ("exit 3", ""),
+        ]:
+            executor = TestExecutor(
+                command=command,
+                working_directory=Path.cwd(),
+                timeout_seconds=10,
+            )
+
+            result = executor.execute()
+
+            assert expected in result.stdout
+        assert result.exit_code == 3
+
     def test_empty_environment_dict(self):
         """Test with explicitly empty environment dict."""
         executor = TestExecutor(
@@ -221,6 +270,86 @@ class TestTestExecutor:
 
         assert result.exit_code == 0
 
+    def test_writes_full_logs_to_log_dir(self):
+        """Test that full stdout/stderr are kept on disk when log_dir is set."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            executor = TestExecutor(
+                command="echo 'stdout line' && echo 'stderr line' >&2",
+                working_directory=Path.cwd(),
+                timeout_seconds=10,
+                log_dir=Path(tmpdir),
+            )
+
+            result = executor.execute()
+
+            assert result.stdout_path == Path(tmpdir) / "test_stdout.log"
+            assert result.stderr_path == Path(tmpdir) / "test_stderr.log"
+            assert "stdout line" in result.stdout_path.read_text()
+            assert "stderr line" in result.stderr_path.read_text()
+
+    def test_log_file_is_readable_while_running(self):
+        """Test that output can be followed from the log file before the command exits."""
+        import threading
+        import time
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            executor = TestExecutor(
+                command="echo 'early line' && sleep 2",
+                working_directory=Path.cwd(),
+                timeout_seconds=10,
+                log_dir=Path(tmpdir),
+            )
+            log_file = executor.log_file("stdout")
+            assert log_file == Path(tmpdir) / "test_stdout.log"
+
+            thread = threading.Thread(target=executor.execute)
+            thread.start()
+            try:
+                deadline = time.monotonic() + 1.5
+                seen = False
+                while time.monotonic() < deadline and not seen:
+                    seen = log_file.exists() and "early line" in log_file.read_text()
+                    time.sleep(0.05)
+                assert seen
+                assert thread.is_alive()
+            finally:
+                thread.join()
+
+    def test_log_file_without_log_dir(self):
+        """Test that no log file is reported when output goes to temporary files."""
+        executor = TestExecutor(command="true", working_directory=Path.cwd())
+        assert executor.log_file("stdout") is None
+
+    def test_keeps_only_output_tail_in_memory(self):
+        """Test that large output is truncated to the last max_output_bytes."""
+        executor = TestExecutor(
+            command="python3 -c \"print('x' * 5000); print('summary line')\"",
+            working_directory=Path.cwd(),
+            timeout_seconds=10,
+            max_output_bytes=100,
+        )
+
+        result = executor.execute()
+
+        assert result.stdout_path is None
+        assert "summary line" in result.stdout
+        assert "truncated" in result.stdout
+        assert len(result.stdout) < 200
+
+    def test_output_tail_does_not_split_characters(self):
+        """Test that truncating inside a multi-byte character leaves no replacement char."""
+        executor = TestExecutor(
+            command="printf 'éééééééééé'",
+            working_directory=Path.cwd(),
+            timeout_seconds=10,
+            max_output_bytes=5,
+        )
+
+        result = executor.execute()
+
+        assert "\ufffd" not in result.stdout
+        assert result.stdout.endswith("éé")
+
     def test_preserves_exit_codes(self):
         """Test that various exit codes are preserved."""
         for exit_code in [0, 1, 2, 127]:
@@ -234,3 +363,23 @@ class TestTestExecutor:
 
             if exit_code != 127:  # 127 might be special on some systems
                 assert result.exit_code == exit_code
+
+
+class TestEnsureDir:
+    """Tests for the ensure_dir helper."""
+
+    def test_creates_nested_directory_once(self):
+        """Test that directories are created and later calls skip mkdir."""
+        from unittest.mock import patch
+
+        from testrunner.core.fs import ensure_dir
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "a" / "b"
+
+            assert ensure_dir(target) == target
+            assert target.is_dir()
+
+            with patch.object(Path, "mkdir") as mkdir:
+                ensure_dir(target)
+            mkdir.assert_not_called()
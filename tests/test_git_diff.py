@@ -0,0 +1,156 @@
+"""Tests for git diff analysis."""
+
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from testrunner.git import diff
+from testrunner.git.diff import GitDiffAnalyzer
+
+GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "Test",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, env=GIT_ENV, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo():
+    """Create a repository with committed, staged, unstaged and untracked changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+        _git(path, "init", "-q", ".")
+        for name in ["keep.py", "mod.py", "gone.py", "staged.py", "unstaged.py"]:
+            (path / name).write_text(f"# {name}\n" + "x = 1\n" * 20)
+        _git(path, "add", "-A")
+        _git(path, "commit", "-qm", "initial")
+
+        (path / "mod.py").write_text("changed\n")
+        (path / "gone.py").unlink()
+        (path / "new file.py").write_text("new\n")
+        _git(path, "add", "-A")
+        _git(path, "commit", "-qm", "second\n\nbody")
+
+        (path / "staged.py").write_text("staged\n")
+        (path / "index_only.py").write_text("added to index\n")
+        _git(path, "add", "staged.py", "index_only.py")
+        (path / "unstaged.py").write_text("unstaged\n")
+        (path / "sub").mkdir()
+        (path / "sub" / "untracked.py").write_text("untracked\n")
+
+        yield path
+
+
+@pytest.fixture
+def no_pygit2(monkeypatch):
+    """Force the git subprocess path."""
+    monkeypatch.setattr(diff, "pygit2", None)
+
+
+class TestGitDiffAnalyzer:
+    """Tests for GitDiffAnalyzer."""
+
+    def test_committed_changes(self, repo, no_pygit2):
+        """Test that committed changes are read from a single diff."""
+        analyzer = GitDiffAnalyzer(repo)
+
+        files = analyzer._get_committed_changes("HEAD~1")
+
+        # Change types and line counts both describe compare_ref -> HEAD
+        assert [(f["path"], f["change_type"], f["additions"], f["deletions"]) for f in files] == [
+            ("gone.py", "D", 0, 21),
+            ("mod.py", "M", 1, 21),
+            ("new file.py", "A", 1, 0),
+        ]
+
+    def test_added_file_reports_additions(self, repo, no_pygit2):
+        """Test that a newly added file is reported as added, with its lines as additions."""
+        (repo / "added.py").write_text("a = 1\nb = 2\nc = 3\n")
+        _git(repo, "add", "added.py")
+        _git(repo, "commit", "-qm", "add a file")
+        analyzer = GitDiffAnalyzer(repo)
+
+        files = analyzer._get_committed_changes("HEAD~1")
+
+        added = next(f for f in files if f["path"] == "added.py")
+        assert (added["change_type"], added["additions"], added["deletions"]) == ("A", 3, 0)
+
+    def test_committed_changes_pygit2_matches_git(self, repo):
+        """Test that the libgit2 fast path reports the same entries as git."""
+        if diff.pygit2 is None:
+            pytest.skip("pygit2 not installed")
+        (repo / "keep.py").rename(repo / "kept.py")
+        (repo / "mod.py").write_text("changed again\n")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-qm", "rename")
+        analyzer = GitDiffAnalyzer(repo)
+
+        fast = analyzer._get_committed_changes_pygit2("HEAD~1")
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(diff, "pygit2", None)
+            slow = analyzer._get_committed_changes("HEAD~1")
+
+        assert fast == slow
+        assert any(f["change_type"] == "R" for f in fast)
+
+    def test_committed_changes_unknown_ref(self, repo, no_pygit2):
+        """Test that an unknown ref yields no files instead of raising."""
+        analyzer = GitDiffAnalyzer(repo)
+
+        assert analyzer._get_committed_changes("does-not-exist") == []
+
+    def test_uncommitted_changes(self, repo):
+        """Test staged, unstaged and untracked files from a subdirectory."""
+        analyzer = GitDiffAnalyzer(repo / "sub")
+
+        files, untracked = analyzer._get_uncommitted_changes()
+
+        assert [(f["path"], f["change_type"], f["additions"], f["deletions"]) for f in files] == [
+            ("index_only.py", "A", 1, 0),
+            ("staged.py", "M", 1, 21),
+            ("unstaged.py", "M", 1, 21),
+        ]
+        assert [f["path"] for f in untracked] == ["sub/untracked.py"]
+
+    def test_analyze_summary(self, repo, no_pygit2):
+        """Test that analyze merges committed and uncommitted files."""
+        analyzer = GitDiffAnalyzer(repo)
+
+        result = analyzer.analyze(compare_ref="HEAD~1")
+
+        paths = [f["path"] for f in result["files"]]
+        assert len(paths) == len(set(paths))
+        assert {"mod.py", "staged.py", "unstaged.py"} <= set(paths)
+        assert result["summary"]["total_files_changed"] == len(paths)
+        assert result["current_commit"] is not None
+
+    def test_recent_commits(self, repo):
+        """Test that recent commits and their files come from one log walk."""
+        analyzer = GitDiffAnalyzer(repo)
+
+        commits = analyzer._get_recent_commits("HEAD~5")
+
+        assert [c["message"] for c in commits] == ["second\n\nbody", "initial"]
+        assert commits[0]["files_changed"] == ["gone.py", "mod.py", "new file.py"]
+        assert commits[0]["author"] == "Test"
+        assert commits[0]["short_hash"] == commits[0]["hash"][:8]
+        # Root commits have no parent to diff against
+        assert commits[1]["files_changed"] == []
+
+    def test_recent_commits_range(self, repo):
+        """Test that non-HEAD~N refs select the ref..HEAD range."""
+        analyzer = GitDiffAnalyzer(repo)
+        first = analyzer._get_recent_commits("HEAD~5")[-1]["hash"]
+
+        commits = analyzer._get_recent_commits(first)
+
+        assert [c["message"] for c in commits] == ["second\n\nbody"]
@@ -0,0 +1,213 @@
+"""Tests for git history analysis."""
+
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from testrunner.git import history
+from testrunner.git.history import GitHistoryAnalyzer, _write_commit_graph
+
+GIT_ENV = {
+    **os.environ,
+    "GIT_COMMITTER_NAME": "Committer",
+    "GIT_COMMITTER_EMAIL": "committer@example.com",
+}
+
+
+def _commit(repo: Path, author: str, message: str, date: str) -> None:
+    env = {
+        **GIT_ENV,
+        "GIT_AUTHOR_NAME": author,
+        "GIT_AUTHOR_EMAIL": f"{author.lower()}@example.com",
+        "GIT_AUTHOR_DATE": date,
+        "GIT_COMMITTER_DATE": date,
+    }
+    for args in (["add", "-A"], ["commit", "-qm", message]):
+        subprocess.run(["git", *args], cwd=repo, env=env, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo():
+    """Create a repository with a short history by two authors."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+        subprocess.run(["git", "init", "-q", "."], cwd=path, check=True)
+        (path / "app.py").write_text("v1\n")
+        (path / "old_name.py").write_text("# helpers\n" + "x = 1\n" * 20)
+        _commit(path, "Alice", "initial", "2024-01-01T10:00:00+02:00")
+
+        (path / "app.py").write_text("v2\n")
+        (path / "test_app.py").write_text("t1\n")
+        _commit(path, "Bob", "add tests", "2024-01-02T23:30:00-05:00")
+
+        (path / "app.py").write_text("v3\n")
+        (path / "test_app.py").write_text("t2\n")
+        (path / "old_name.py").rename(path / "new_name.py")
+        _commit(path, "Alice", "rename helpers", "2024-01-03T12:00:00+00:00")
+
+        (path / "sub").mkdir()
+        yield path
+
+
+@pytest.fixture(autouse=True)
+def graph_writes():
+    """Record commit-graph writes instead of starting them in the background.
+
+    Uses its own MonkeyPatch so tests calling monkeypatch.undo() keep it.
+    """
+    calls = []
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(history, "_write_commit_graph", calls.append)
+        yield calls
+
+
+class TestGitHistoryAnalyzer:
+    """Tests for GitHistoryAnalyzer."""
+
+    def test_file_contributors(self, repo):
+        """Test that contributors are counted per author email."""
+        analyzer = GitHistoryAnalyzer(repo / "sub")
+
+        contributors = analyzer.get_file_contributors("app.py")
+
+        assert [(c.name, c.commits) for c in contributors] == [("Alice", 2), ("Bob", 1)]
+        assert contributors[0].last_commit_date.isoformat() == "2024-01-03T12:00:00+00:00"
+        assert contributors[1].email == "bob@example.com"
+        assert (contributors[0].lines_added, contributors[0].lines_removed) == (2, 1)
+        assert (contributors[1].lines_added, contributors[1].lines_removed) == (1, 1)
+
+    def test_file_contributors_batch(self, repo):
+        """Test that batched lookups match the per-file results."""
+        analyzer = GitHistoryAnalyzer(repo)
+        paths = ["app.py", "test_app.py", "app.py", "missing.py"]
+
+        batch = analyzer.get_file_contributors_batch(paths, max_workers=2)
+
+        assert list(batch) == ["app.py", "test_app.py", "missing.py"]
+        for path, contributors in batch.items():
+            assert contributors == analyzer.get_file_contributors(path)
+        assert batch["missing.py"] == []
+
+    def test_hotspot_files(self, repo):
+        """Test that hotspots skip the root commit and report renames by old path."""
+        analyzer = GitHistoryAnalyzer(repo)
+
+        hotspots = analyzer.get_hotspot_files()
+
+        assert hotspots == [
+            {"path": "app.py", "change_count": 2, "unique_authors": 2},
+            {"path": "test_app.py", "change_count": 2, "unique_authors": 2},
+            {"path": "old_name.py", "change_count": 1, "unique_authors": 1},
+        ]
+
+    def test_find_related_files(self, repo):
+        """Test that co-changes include files outside the pathspec."""
+        analyzer = GitHistoryAnalyzer(repo)
+
+        related = analyzer.find_related_files("app.py")
+
+        assert related == [
+            {"path": "test_app.py", "co_change_count": 2},
+            {"path": "old_name.py", "co_change_count": 1},
+        ]
+
+    def test_recently_modified_and_frequency(self, repo):
+        """Test the time-bounded queries against committer-local dates."""
+        analyzer = GitHistoryAnalyzer(repo)
+
+        recent = analyzer.get_recently_modified_files(days=100000)
+        frequency = analyzer.get_commit_frequency(days=100000)
+
+        assert recent[0] == {
+            "path": "app.py",
+            "modifications": 2,
+            "last_modified": "2024-01-03T12:00:00+00:00",
+            "last_author": "Alice",
+        }
+        assert frequency == {"2024-01-01": 1, "2024-01-02": 1, "2024-01-03": 1}
+
+    def test_not_a_repository(self):
+        """Test that queries outside a repository return empty results."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            analyzer = GitHistoryAnalyzer(tmpdir)
+
+            assert analyzer.get_hotspot_files() == []
+            assert analyzer.find_related_files("app.py") == []
+
+    def test_first_analysis_writes_commit_graph(self, repo, graph_writes):
+        """Test that opening the repository for analysis requests a commit-graph."""
+        GitHistoryAnalyzer(repo / "sub").get_file_contributors("app.py")
+
+        assert [Path(d).resolve() for d in graph_writes] == [(repo / ".git").resolve()]
+
+    def test_write_commit_graph_once(self, repo):
+        """Test that a missing commit-graph is written once, in the background."""
+        git_dir = str(repo / ".git")
+        graph = repo / ".git" / "objects" / "info" / "commit-graph"
+
+        thread = _write_commit_graph(git_dir)
+
+        assert thread is not None
+        thread.join()
+        assert graph.exists()
+        graph.unlink()
+        assert _write_commit_graph(git_dir) is None
+        assert not graph.exists()
+
+    def test_contributors_cached_until_head_moves(self, repo):
+        """Test that contributor lookups are reused until a new commit lands."""
+        first = GitHistoryAnalyzer(repo).get_file_contributors("app.py")
+        assert GitHistoryAnalyzer(repo / ".").get_file_contributors("app.py") == first
+
+        (repo / "app.py").write_text("v4\n")
+        _commit(repo, "Carol", "carol's change", "2024-01-04T12:00:00+00:00")
+        second = GitHistoryAnalyzer(repo).get_file_contributors("app.py")
+
+        assert [c.name for c in first] == ["Alice", "Bob"]
+        assert [c.name for c in second] == ["Alice", "Carol", "Bob"]
+
+    def test_cached_contributors_not_shared(self, repo):
+        """Test that mutating returned contributors does not change later lookups."""
+        first = GitHistoryAnalyzer(repo).get_file_contributors("app.py")
+        first[0].commits = 99
+        batch = GitHistoryAnalyzer(repo).get_file_contributors_batch(["app.py"])
+        batch["app.py"][0].commits = 98
+
+        second = GitHistoryAnalyzer(repo).get_file_contributors("app.py")
+
+        assert [c.commits for c in second] == [2, 1]
+
+    def test_hotspots_cached_on_disk_until_head_moves(self, repo, monkeypatch):
+        """Test that hotspot results are reused across analyzers for the same HEAD."""
+        first = GitHistoryAnalyzer(repo).get_hotspot_files()
+        assert (repo / ".git" / "testrunner" / "history.cache.json").exists()
+
+        def fail(self, limit):
+            raise AssertionError("should be served from the cache")
+
+        monkeypatch.setattr(GitHistoryAnalyzer, "_hotspot_files", fail)
+        assert GitHistoryAnalyzer(repo).get_hotspot_files() == first
+
+        monkeypatch.undo()
+        (repo / "test_app.py").write_text("t3\n")
+        _commit(repo, "Bob", "more tests", "2024-01-04T12:00:00+00:00")
+        hotspots = GitHistoryAnalyzer(repo).get_hotspot_files()
+
+        assert hotspots[0] == {"path": "test_app.py", "change_count": 3, "unique_authors": 2}
+
+    def test_failed_queries_not_cached(self, repo, monkeypatch):
+        """Test that a failed history walk is not served from the cache afterwards."""
+
+        def fail(self, *args, **kwargs):
+            raise subprocess.CalledProcessError(128, "git log")
+
+        monkeypatch.setattr(GitHistoryAnalyzer, "_log", fail)
+        assert GitHistoryAnalyzer(repo).get_hotspot_files() == []
+        assert GitHistoryAnalyzer(repo).find_related_files("app.py") == []
+
+        monkeypatch.undo()
+        assert GitHistoryAnalyzer(repo).get_hotspot_files()
+        assert GitHistoryAnalyzer(repo).find_related_files("app.py")
@@ -1,5 +1,8 @@
 """Tests for LLM-based failure analyzer."""
 
+import asyncio
+import threading
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -156,8 +159,8 @@ class TestFailureAnalyzer:
             error_message="Error 2",
         )
 
-        mock_llm_client.generate_json.side_effect = [
-            {
+        responses = {
+            "Error 1": {
                 "likely_cause": "Cause 1",
                 "suspected_file": None,
                 "suspected_commit": None,
@@ -165,7 +168,7 @@ class TestFailureAnalyzer:
                 "explanation": "Explanation 1",
                 "suggested_fix": "Fix 1",
             },
-            {
+            "Error 2": {
                 "likely_cause": "Cause 2",
                 "suspected_file": None,
                 "suspected_commit": None,
@@ -173,7 +176,13 @@ class TestFailureAnalyzer:
                 "explanation": "Explanation 2",
                 "suggested_fix": "Fix 2",
             },
-        ]
+        }
+
+        # Analyses run concurrently, so answer by prompt content rather than call order
+        def generate_json(prompt, **kwargs):
+            return next(r for error, r in responses.items() if error in prompt)
+
+        mock_llm_client.generate_json.side_effect = generate_json
 
         analyzer = FailureAnalyzer(mock_llm_client)
         results = analyzer.analyze_multiple([test1, test2])
@@ -184,6 +193,119 @@ class TestFailureAnalyzer:
         assert results[0].likely_cause == "Cause 1"
         assert results[1].likely_cause == "Cause 2"
 
+    def test_analyze_multiple_respects_concurrency_limit(self, mock_llm_client):
+        """Test that analyze_multiple never exceeds max_concurrency in-flight calls."""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def generate_json(prompt, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return {"likely_cause": "Cause"}
+
+        mock_llm_client.generate_json.side_effect = generate_json
+        tests = [
+            TestResult(
+                test_name=f"test{i}",
+                test_file="test.py",
+                status=TestStatus.FAILED,
+                error_message=f"Error {i}",
+            )
+            for i in range(8)
+        ]
+
+        analyzer = FailureAnalyzer(mock_llm_client, max_concurrency=2)
+        results = analyzer.analyze_multiple(tests)
+
+        assert [r.test_name for r in results] == [f"test{i}" for i in range(8)]
+        assert 1 <= peak <= 2
+
+    def test_analyze_multiple_keeps_response_with_analysis(self, mock_llm_client):
+        """Test that each analysis carries the response it was built from."""
+
+        def generate_json(prompt, **kwargs):
+            # Answer the first failure last so completion order differs from input order
+            if "Error 0" in prompt:
+                time.sleep(0.05)
+            return {"likely_cause": "Cause 0" if "Error 0" in prompt else "Cause 1"}
+
+        mock_llm_client.generate_json.side_effect = generate_json
+        tests = [
+            TestResult(test_name=f"test{i}", status=TestStatus.FAILED, error_message=f"Error {i}")
+            for i in range(2)
+        ]
+
+        results = FailureAnalyzer(mock_llm_client).analyze_multiple(tests)
+
+        assert [r.raw_response for r in results] == [
+            {"likely_cause": "Cause 0"},
+            {"likely_cause": "Cause 1"},
+        ]
+        assert "raw_response" not in results[0].to_dict()
+
+    def test_analyze_multiple_inside_running_loop(self, mock_llm_client):
+        """Test that analyze_multiple falls back to sequential analysis in a running loop."""
+        mock_llm_client.generate_json.return_value = {"likely_cause": "Cause"}
+        tests = [
+            TestResult(test_name=f"test{i}", status=TestStatus.FAILED, error_message=f"Error {i}")
+            for i in range(3)
+        ]
+        analyzer = FailureAnalyzer(mock_llm_client)
+
+        async def run():
+            return analyzer.analyze_multiple(tests)
+
+        results = asyncio.run(run())
+
+        assert [r.test_name for r in results] == ["test0", "test1", "test2"]
+
+    def test_analyze_batch_single_request(self, mock_llm_client, git_changes):
+        """Test that analyze_batch analyzes all failures with one LLM call."""
+        tests = [
+            TestResult(test_name="test1", status=TestStatus.FAILED, error_message="Error 1"),
+            TestResult(test_name="test2", status=TestStatus.FAILED, error_message="Error 2"),
+        ]
+        mock_llm_client.generate_json.return_value = {
+            "analyses": [
+                {"test_name": "test2", "likely_cause": "Cause 2", "confidence": 0.8},
+                {"test_name": "test1", "likely_cause": "Cause 1", "confidence": 0.7},
+            ]
+        }
+
+        analyzer = FailureAnalyzer(mock_llm_client)
+        results = analyzer.analyze_batch(tests, git_changes)
+
+        assert mock_llm_client.generate_json.call_count == 1
+        prompt = mock_llm_client.generate_json.call_args.kwargs["prompt"]
+        assert "Error 1" in prompt and "Error 2" in prompt
+        assert prompt.count("Recently Changed Files") == 1
+        assert [r.test_name for r in results] == ["test1", "test2"]
+        assert results[0].likely_cause == "Cause 1"
+        assert results[1].likely_cause == "Cause 2"
+
+    def test_analyze_batch_falls_back_per_test(self, mock_llm_client):
+        """Test that failures missing from the batch response are analyzed individually."""
+        tests = [
+            TestResult(test_name="test1", status=TestStatus.FAILED, error_message="Error 1"),
+            TestResult(test_name="test2", status=TestStatus.FAILED, error_message="Error 2"),
+        ]
+        mock_llm_client.generate_json.side_effect = [
+            {"analyses": [{"test_name": "test1", "likely_cause": "Cause 1"}]},
+            {"likely_cause": "Cause 2"},
+        ]
+
+        analyzer = FailureAnalyzer(mock_llm_client)
+        results = analyzer.analyze_batch(tests)
+
+        assert mock_llm_client.generate_json.call_count == 2
+        assert [r.likely_cause for r in results] == ["Cause 1", "Cause 2"]
+
     def test_prompt_building(self, mock_llm_client, failed_test_result, git_changes):
         """Test that analysis prompt is built correctly."""
         analyzer = FailureAnalyzer(mock_llm_client)
@@ -197,6 +319,24 @@ class TestFailureAnalyzer:
         assert "Fix division logic" in prompt  # Commit message
         assert "JSON" in prompt
 
+    def test_prompt_context_built_once(
+        self, mock_llm_client, failed_test_result, git_changes, monkeypatch
+    ):
+        """Test that the shared context section is reused across prompts."""
+        analyzer = FailureAnalyzer(mock_llm_client)
+        calls = []
+        build = analyzer._build_context_parts
+        monkeypatch.setattr(
+            analyzer, "_build_context_parts", lambda *a: calls.append(a) or build(*a)
+        )
+
+        first = analyzer._build_analysis_prompt(failed_test_result, git_changes, "hints")
+        second = analyzer._build_analysis_prompt(failed_test_result, git_changes, "hints")
+        analyzer._build_analysis_prompt(failed_test_result, None, "hints")
+
+        assert first == second
+        assert len(calls) == 2
+
     def test_prompt_without_git_context(self, mock_llm_client, failed_test_result):
         """Test prompt building without git context."""
         analyzer = FailureAnalyzer(mock_llm_client)
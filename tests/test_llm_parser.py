@@ -213,6 +213,48 @@ class TestLLMOutputParser:
         assert result.parse_confidence < 1.0  # Low confidence
         assert len(result.tests) == 0  # Can't extract individual tests
 
+    def test_fallback_parser_counts_whole_words_only(self):
+        """Test that fallback counting ignores keywords embedded in other words."""
+        mock_client = Mock()
+        mock_client.is_available.return_value = False
+
+        parser = LLMOutputParser(mock_client)
+        result = parser.parse(
+            stdout="bookkeeping token passport\ntest_a PASSED\ntest_b ok\n",
+            stderr="Failure in error_handler\ntest_c FAILED\n",
+            exit_code=1,
+        )
+
+        assert result.passed == 2
+        assert result.failed == 1
+        assert result.skipped == 0
+
+    def test_fallback_parser_matches_dotless_i(self):
+        """Test that the keyword prefilter agrees with the case-insensitive regex."""
+        mock_client = Mock()
+        mock_client.is_available.return_value = False
+
+        parser = LLMOutputParser(mock_client)
+        result = parser.parse(stdout="test_a skıP\ntest_b FAıL\n", stderr="", exit_code=1)
+
+        assert result.skipped == 1
+        assert result.failed == 1
+
+    def test_fallback_parser_keeps_output_tail(self):
+        """Test that only the tail of very large output is retained."""
+        mock_client = Mock()
+        mock_client.is_available.return_value = False
+
+        parser = LLMOutputParser(mock_client)
+        result = parser.parse(
+            stdout="x" * 100000,
+            stderr="1 failed in 0.5s",
+            exit_code=1,
+        )
+
+        assert len(result.raw_output) == 65536
+        assert result.raw_output.endswith("1 failed in 0.5s")
+
     def test_fallback_parser_on_llm_error(self, mock_llm_client, pytest_output):
         """Test fallback when LLM raises exception."""
         mock_llm_client.generate_json.side_effect = Exception("LLM error")
@@ -270,6 +312,15 @@ class TestLLMOutputParser:
 
         assert result.total == 0
         assert len(result.tests) == 0
+        mock_llm_client.generate_json.assert_not_called()
+
+    def test_empty_output_with_failing_exit_code(self, mock_llm_client):
+        """Test that empty output from a failing command counts one failure."""
+        parser = LLMOutputParser(mock_llm_client)
+        result = parser.parse(stdout="", stderr="  \n", exit_code=2)
+
+        assert result.failed == 1
+        mock_llm_client.generate_json.assert_not_called()
 
     def test_handles_malformed_llm_response(self, mock_llm_client):
         """Test handling of malformed LLM response."""
@@ -308,6 +359,40 @@ class TestLLMOutputParser:
         assert len(prompt) < len(long_output)
         assert "truncated" in prompt
 
+    def test_truncation_keeps_output_tail(self, mock_llm_client):
+        """Test that truncation keeps the end of the output, where the summary is."""
+        parser = LLMOutputParser(mock_llm_client)
+        prompt = parser._build_parse_prompt(
+            stdout="first line\n" + "x" * 20000 + "\n3 failed, 10 passed",
+            stderr="",
+            exit_code=1,
+            test_command=None,
+            language=None,
+        )
+
+        assert "3 failed, 10 passed" in prompt
+        assert "first line" not in prompt
+
+    def test_fallback_parser_counts_full_log_files(self, tmp_path):
+        """Test that fallback counts come from the full logs, not the in-memory tail."""
+        mock_client = Mock()
+        mock_client.is_available.return_value = False
+        stdout_log = tmp_path / "test_stdout.log"
+        stderr_log = tmp_path / "test_stderr.log"
+        stdout_log.write_text("test_a PASSED\n" * 50 + "test_b FAILED\n")
+        stderr_log.write_text("test_c SKIPPED\n")
+
+        parser = LLMOutputParser(mock_client)
+        result = parser.parse(
+            stdout="test_b FAILED\n",
+            stderr="",
+            exit_code=1,
+            log_paths=(stdout_log, stderr_log),
+        )
+
+        assert (result.passed, result.failed, result.skipped) == (50, 1, 1)
+        assert result.raw_output.strip() == "test_b FAILED"
+
     def test_to_dict_conversion(self, mock_llm_client):
         """Test ParsedTestOutput.to_dict() method."""
         mock_llm_client.generate_json.return_value = {
@@ -2,7 +2,6 @@
 
 from datetime import datetime
 
-import pytest
 
 from testrunner.storage.models import (
     TestRun,
@@ -100,6 +99,15 @@ class TestTestResult:
         assert d["status"] == "failed"
         assert d["duration_ms"] == 100
 
+    def test_to_dict_returns_fresh_dict(self):
+        """Test that editing a returned dict does not affect later calls."""
+        result = TestResult(test_name="test_example", run_id=1)
+
+        d = result.to_dict()
+        d["run_id"] = 99
+
+        assert result.to_dict()["run_id"] == 1
+
 
 class TestRootCauseAnalysis:
     """Tests for RootCauseAnalysis model."""
@@ -1,6 +1,5 @@
 """Tests for the OpenRouter LLM client."""
 
-import json
 from unittest.mock import MagicMock, patch
 
 import httpx
@@ -225,3 +224,73 @@ class TestOpenRouterClient:
 
             result = client.generate_json("return JSON")
             assert result == {"key": "value"}
+
+    def test_generate_json_extracts_object_from_prose(self, client):
+        """Test that JSON wrapped in prose is found by brace matching."""
+        content = 'Sure! {"msg": "a } in \\"text\\"", "n": {"x": 1}} Note: {braces} are fine.'
+        mock_response = {
+            "choices": [
+                {"message": {"content": content}}
+            ],
+            "model": "test/model:free",
+        }
+
+        mock_http = MagicMock()
+        mock_http.json.return_value = mock_response
+        mock_http.raise_for_status = MagicMock()
+
+        with patch("httpx.Client") as mock_client:
+            mock_client.return_value.__enter__ = MagicMock(return_value=MagicMock(
+                post=MagicMock(return_value=mock_http)
+            ))
+            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+
+            result = client.generate_json("return JSON")
+            assert result == {"msg": 'a } in "text"', "n": {"x": 1}}
+
+    @pytest.mark.parametrize("orjson", [None, "default"])
+    def test_generate_json_accepts_stdlib_only_json(self, client, orjson):
+        """Test that values orjson rejects still parse, with or without orjson."""
+        mock_response = {
+            "choices": [
+                {"message": {"content": '{"ratio": NaN, "big": 18446744073709551616}'}}
+            ],
+            "model": "test/model:free",
+        }
+
+        mock_http = MagicMock()
+        mock_http.json.return_value = mock_response
+        mock_http.raise_for_status = MagicMock()
+
+        with patch("httpx.Client") as mock_client:
+            mock_client.return_value.__enter__ = MagicMock(return_value=MagicMock(
+                post=MagicMock(return_value=mock_http)
+            ))
+            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+
+            if orjson is None:
+                with patch("testrunner.llm.base.orjson", None):
+                    result = client.generate_json("return JSON")
+            else:
+                result = client.generate_json("return JSON")
+
+            assert result["big"] == 2**64
+            assert result["ratio"] != result["ratio"]
+
+    def test_is_available_reuses_recent_probe(self, client):
+        """Test that availability is probed once per TTL window."""
+        with patch("httpx.Client") as mock_client:
+            mock_inner = MagicMock()
+            mock_inner.get.return_value = MagicMock(status_code=200)
+            mock_client.return_value.__enter__ = MagicMock(return_value=mock_inner)
+            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+
+            assert client.is_available() is True
+            assert client.is_available() is True
+            assert mock_inner.get.call_count == 1
+
+            # Once the window has passed the service is probed again
+            mock_inner.get.return_value = MagicMock(status_code=503)
+            client._available_until = 0.0
+            assert client.is_available() is False
+            assert mock_inner.get.call_count == 2